@@ -1610,14 +1610,16 @@ def api_identify():
         if not screen.get("usable", True):
             return jsonify({"error": f"Image not usable: {screen.get('reason', 'too blurry or unclear')}", "prescreen": screen}), 200
 
-        # Tier 2: Sonnet full identification
-        result = identifier.identify_card(str(filepath), model=MODEL_SMART)
-        log_cost("identify", MODEL_SMART, result._input_tok, result._output_tok)
+        # Tier 2: routed identification — confident prescreens stay on Haiku
+        first_model = route_identify(screen.get("confidence", 0.0))
+        result = identifier.identify_card(str(filepath), model=first_model)
+        log_cost("identify", first_model, result._input_tok, result._output_tok)
 
-        # Tier 3: If confidence is low, retry with best model
+        # Tier 3: If confidence is low, retry with a better model
         if result.confidence < 0.55:
-            better_model = route_identify(result.confidence, attempt=2)
-            if better_model != MODEL_SMART:
+            better_model = route_identify(screen.get("confidence", 0.0),
+                                          prev_conf=result.confidence, attempt=2)
+            if better_model != first_model:
                 result = identifier.identify_card(str(filepath), model=better_model)
                 log_cost("identify_escalated", better_model, result._input_tok, result._output_tok,
                          notes=f"escalated from confidence={result.confidence:.2f}")
@@ -1659,14 +1661,16 @@ def api_identify_batch():
                 })
                 continue
 
-            # Sonnet full ID
-            ident = identifier.identify_card(str(filepath), model=MODEL_SMART)
-            log_cost("identify_batch", MODEL_SMART, ident._input_tok, ident._output_tok)
+            # Routed full ID — confident prescreens stay on Haiku
+            first_model = route_identify(screen.get("confidence", 0.0))
+            ident = identifier.identify_card(str(filepath), model=first_model)
+            log_cost("identify_batch", first_model, ident._input_tok, ident._output_tok)
 
             # Escalate if low confidence
             if ident.confidence < 0.55:
-                better = route_identify(ident.confidence, attempt=2)
-                if better != MODEL_SMART:
+                better = route_identify(screen.get("confidence", 0.0),
+                                        prev_conf=ident.confidence, attempt=2)
+                if better != first_model:
                     ident = identifier.identify_card(str(filepath), model=better)
                     log_cost("identify_escalated", better, ident._input_tok, ident._output_tok)
 
@@ -1690,7 +1694,8 @@ def api_save_batch():
     cards_in = data.get("cards", [])
     booklet_name = data.get("booklet_name", "")
     page_number = data.get("page_number", 1)
-    saved = 0
+    booklet_id = None
+    batch = []
 
     for c in cards_in:
         if c.get("error"):
@@ -1714,11 +1719,13 @@ def api_save_batch():
             booklet_name=booklet_name, page_number=page_number,
         )
         if booklet_name:
-            bid, _ = db.get_or_create_booklet(booklet_name, sport=c.get("sport", ""))
-            card.booklet_id = bid
-        db.add_card(card)
-        saved += 1
+            if booklet_id is None:
+                booklet_id, _ = db.get_or_create_booklet(booklet_name, sport=c.get("sport", ""))
+            card.booklet_id = booklet_id
+        batch.append(card)
 
+    # One transaction for the whole sheet instead of a commit per card
+    saved = db.add_cards(batch)
     return jsonify({"count": saved})
 
 
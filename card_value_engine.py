@@ -4,15 +4,100 @@ Critical sections cleaned: multiplier stacking, sport detection, mock data, conf
 Author: HutchGroup LLC
 """
 
+import heapq
 import json
+import math
+import random
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from bisect import bisect_right
 import statistics
 import hashlib
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import re
 
+try:
+    import numpy as _np
+except ImportError:
+    _np = None  # Pure-Python fallback — NumPy only accelerates batch math
+
+try:
+    from numba import njit as _njit
+except ImportError:
+    def _njit(func=None, **_kwargs):
+        # No-op decorator — Numba is an optional accelerator, not a requirement
+        if func is None:
+            return lambda f: f
+        return func
+
+
+def _mean_stdev(values) -> Tuple[float, float]:
+    """
+    Mean and sample standard deviation in one pass.
+
+    statistics.mean + statistics.stdev walk the data three times (stdev
+    recomputes the mean internally); the coefficient-of-variation checks only
+    need both numbers once, so accumulate sum and sum of squares directly.
+    """
+    n = len(values)
+    total = 0.0
+    total_sq = 0.0
+    for v in values:
+        total += v
+        total_sq += v * v
+    mean = total / n
+    if n < 2:
+        return mean, 0.0
+    # max() guards the tiny negative residue floating point can leave behind
+    variance = max(0.0, (total_sq - n * mean * mean) / (n - 1))
+    return mean, math.sqrt(variance)
+
+
+@_njit(cache=True)
+def _aggregate_weighted(medians, weights, counts):
+    """
+    Hot aggregation kernel: combine per-source medians into a weighted value.
+    Operates on primitive parallel sequences only so Numba can compile it in
+    nopython mode when installed; runs as plain Python otherwise.
+    """
+    weighted_sum = 0.0
+    total_weight = 0.0
+    for i in range(len(medians)):
+        scale = counts[i] / 10.0
+        if scale > 1.0:
+            scale = 1.0
+        w = weights[i] * scale
+        weighted_sum += medians[i] * w
+        total_weight += w
+    return weighted_sum, total_weight
+
+# Reused interval constants — date math below builds several offsets per call
+# and repeated timedelta construction adds up in batch scans.
+_ONE_WEEK = timedelta(days=7)
+
+# Baseline trend analysis returned when there is too little data to say more.
+# Kept as a module template so the sparse-data path is a plain dict copy.
+_DEFAULT_TRENDS = {
+    "direction": "stable",
+    "velocity": "normal",
+    "30_day_change": 0.0,
+    "90_day_change": 0.0,
+    "volatility": "low",
+    "recommendation": "hold",
+}
+
+# Breakdown template for the real-comp path — copied per estimate so callers
+# get a dict they own without the engine rebuilding the literal each time
+_REAL_COMP_BREAKDOWN = {"note": "multipliers skipped — real sold comp data"}
+_THREE_DAYS = timedelta(days=3)
+_FIVE_DAYS = timedelta(days=5)
+_TEN_DAYS = timedelta(days=10)
+_THIRTY_DAYS = timedelta(days=30)
+
 
 # ============================================================================
 # DATA MODELS (unchanged — these are solid)
@@ -43,6 +128,10 @@ class Sport(Enum):
     HOCKEY = "hockey"
     OTHER = "other"
 
+# Print run extraction: "23/99" → "99"
+_SERIAL_RUN_RE = re.compile(r'/(\d+)')
+
+
 @dataclass
 class CardAttributes:
     player: str
@@ -60,7 +149,30 @@ class CardAttributes:
     grade_value: Optional[float] = None
     grading_company: Optional[str] = None
 
-@dataclass
+    @cached_property
+    def fingerprint(self) -> tuple:
+        """
+        Canonical identity tuple for this card variant.
+
+        Market fetchers derive both their cache keys and their search
+        queries from this, so the fields are walked (and the print run
+        extracted from serial_number) exactly once per card. Cached on
+        first access — attributes are set at construction and not
+        mutated afterwards.
+        """
+        serial_run = None
+        if self.serial_number:
+            match = _SERIAL_RUN_RE.search(str(self.serial_number))
+            if match:
+                serial_run = match.group(1)
+        grade = None
+        if self.graded and self.grade_value is not None:
+            grade = (self.grading_company or "PSA", self.grade_value)
+        return (self.player, self.year, self.set_name, self.card_number,
+                self.parallel, serial_run,
+                bool(self.rookie), bool(self.autograph), grade)
+
+@dataclass(slots=True)
 class MarketDataPoint:
     source: str
     value: float
@@ -71,7 +183,34 @@ class MarketDataPoint:
     image_url: Optional[str] = None
     notes: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
+class MarketDataArrays:
+    """
+    Structure-of-arrays view over a list of MarketDataPoint.
+
+    The batch passes (confidence, trends, consistency) each touch only one or
+    two fields per point; parallel arrays avoid chasing a Python object per
+    point and let NumPy vectorize the float math when it is installed.
+    """
+    sources: Tuple[str, ...]
+    values: Any           # np.ndarray when NumPy is available, else List[float]
+    dates: Tuple[datetime, ...]
+    sample_sizes: Tuple[int, ...]
+
+    @classmethod
+    def from_points(cls, points: List[MarketDataPoint]) -> "MarketDataArrays":
+        sources = tuple(dp.source for dp in points)
+        raw_values = [dp.value for dp in points]
+        values = _np.asarray(raw_values) if _np is not None else raw_values
+        dates = tuple(dp.date for dp in points)
+        sample_sizes = tuple(dp.sample_size for dp in points)
+        return cls(sources, values, dates, sample_sizes)
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+
+@dataclass(slots=True)
 class ValueEstimate:
     estimated_value: float
     confidence: ConfidenceLevel
@@ -175,62 +314,82 @@ class MultiplierEngine:
         """
         Apply all multipliers and return (adjusted_value, multiplier_breakdown).
         Uses CAPPED compound multiplication to prevent runaway inflation.
+
+        The compound multiplier depends only on the card's attributes, which
+        never change between revaluations of the same card — so the full
+        computation is constant-folded behind an LRU cache keyed on them.
         """
+        capped, breakdown_items = cls._compound_for(
+            card.graded, card.grade_value, card.condition,
+            card.rookie, card.autograph, card.serial_number,
+            card.parallel, card.year, card.sport,
+        )
+        # Fresh dict per call — cached breakdowns must not leak to callers
+        # Unrounded value — the caller rounds once at the output boundary
+        return base_value * capped, dict(breakdown_items)
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _compound_for(cls, graded: bool, grade_value: Optional[float],
+                      condition: CardCondition, rookie: bool, autograph: bool,
+                      serial_number: Optional[str], parallel: Optional[str],
+                      year: int, sport: Sport) -> Tuple[float, Tuple[Tuple[str, float], ...]]:
+        """Pure multiplier computation over hashable attributes (cacheable)."""
         breakdown = {}
-        
+
         # 1. Condition / Grade
-        if card.graded and card.grade_value is not None:
-            grade_mult = cls._grade_multiplier(card.grade_value)
+        if graded and grade_value is not None:
+            grade_mult = cls._grade_multiplier(grade_value)
             breakdown["grade"] = grade_mult
         else:
-            grade_mult = cls.CONDITION_MULTIPLIERS.get(card.condition, 1.0)
+            grade_mult = cls.CONDITION_MULTIPLIERS.get(condition, 1.0)
             breakdown["condition"] = grade_mult
-        
+
         # 2. Rookie
-        rookie_mult = 1.5 if card.rookie else 1.0
-        if card.rookie:
+        rookie_mult = 1.5 if rookie else 1.0
+        if rookie:
             breakdown["rookie"] = rookie_mult
-        
+
         # 3. Autograph
-        auto_mult = 2.5 if card.autograph else 1.0
-        if card.autograph:
+        auto_mult = 2.5 if autograph else 1.0
+        if autograph:
             breakdown["autograph"] = auto_mult
-        
+
         # 4. Serial / Scarcity
-        scarcity_mult = cls._scarcity_multiplier(card.serial_number)
+        scarcity_mult = cls._scarcity_multiplier(serial_number)
         if scarcity_mult != 1.0:
             breakdown["scarcity"] = scarcity_mult
-        
+
         # 5. Parallel
-        parallel_mult = cls._parallel_multiplier(card.parallel)
+        parallel_mult = cls._parallel_multiplier(parallel)
         if parallel_mult != 1.0:
             breakdown["parallel"] = parallel_mult
-        
+
         # 6. Era
-        era = cls._determine_era(card.year)
+        era = cls._determine_era(year)
         era_mult = cls.ERA_MULTIPLIERS.get(era, 1.0)
         breakdown["era"] = era_mult
-        
+
         # 7. Sport market
-        sport_mult = cls.SPORT_FACTORS.get(card.sport, 1.0)
+        sport_mult = cls.SPORT_FACTORS.get(sport, 1.0)
         if sport_mult != 1.0:
             breakdown["sport_market"] = sport_mult
-        
+
         # COMPOUND WITH CAP
         # Instead of naive multiplication, we separate "positive" and "negative" factors
         raw_compound = (
-            grade_mult * rookie_mult * auto_mult * 
+            grade_mult * rookie_mult * auto_mult *
             scarcity_mult * parallel_mult * era_mult * sport_mult
         )
-        
+
         capped = min(raw_compound, cls.MAX_COMPOUND_MULTIPLIER)
         if capped < raw_compound:
             breakdown["_cap_applied"] = cls.MAX_COMPOUND_MULTIPLIER
             breakdown["_uncapped"] = round(raw_compound, 2)
-        
+
         breakdown["_total"] = round(capped, 2)
-        
-        return round(base_value * capped, 2), breakdown
+
+        return capped, tuple(breakdown.items())
     
     @classmethod
     def _grade_multiplier(cls, grade: float) -> float:
@@ -311,33 +470,41 @@ class ConfidenceCalculator:
     }
     
     @classmethod
-    def calculate(cls, card: CardAttributes, 
-                  market_data: List[MarketDataPoint]) -> Tuple[ConfidenceLevel, float, Dict[str, float]]:
-        
+    def calculate(cls, card: CardAttributes,
+                  market_data: List[MarketDataPoint],
+                  arrays: Optional[MarketDataArrays] = None) -> Tuple[ConfidenceLevel, float, Dict[str, float]]:
+
+        if arrays is None:
+            arrays = MarketDataArrays.from_points(market_data)
+
         factors = {}
-        
+
         # Factor 1: Source diversity
-        unique_sources = len(set(dp.source for dp in market_data))
+        unique_sources = len(set(arrays.sources))
         factors["source_diversity"] = min(1.0, unique_sources / 4)
-        
+
         # Factor 2: Sample size
-        total_samples = sum(dp.sample_size for dp in market_data)
+        total_samples = sum(arrays.sample_sizes)
         factors["sample_size"] = min(1.0, total_samples / 20)
-        
+
         # Factor 3: Recency
-        if market_data:
-            cutoff = datetime.now() - timedelta(days=30)
-            recent = sum(1 for dp in market_data if dp.date > cutoff)
-            factors["data_recency"] = recent / len(market_data)
+        if len(arrays):
+            cutoff = datetime.now() - _THIRTY_DAYS
+            recent = sum(1 for d in arrays.dates if d > cutoff)
+            factors["data_recency"] = recent / len(arrays)
         else:
             factors["data_recency"] = 0.0
-        
+
         # Factor 4: Value consistency
-        if len(market_data) > 1:
-            values = [dp.value for dp in market_data]
-            mean_val = statistics.mean(values)
+        if len(arrays) > 1:
+            values = arrays.values
+            if _np is not None:
+                mean_val = float(values.mean())
+                stdev = float(values.std(ddof=1))
+            else:
+                mean_val, stdev = _mean_stdev(values)
             if mean_val > 0:
-                cv = statistics.stdev(values) / mean_val
+                cv = stdev / mean_val
                 factors["value_consistency"] = max(0.0, 1.0 - cv)
             else:
                 factors["value_consistency"] = 0.5
@@ -389,18 +556,21 @@ class MockDataFactory:
     def generate(cls, card: CardAttributes) -> List[MarketDataPoint]:
         base_value = cls._base_value(card)
         points = []
-        
+        now = datetime.now()  # one clock read for all points
+
         # eBay sold listings (5 data points, most important source)
+        # One seeded PRNG per card replaces an MD5 hash per data point —
+        # still deterministic across sessions for the same card.
+        rng = random.Random(cls._seed(f"{card.player}:ebay"))
         for i in range(5):
-            seed = cls._seed(f"{card.player}:ebay:{i}")
-            variance = 1.0 + (seed % 20 - 10) / 100  # ±10%
+            variance = 1.0 + (rng.randrange(20) - 10) / 100  # ±10%
             points.append(MarketDataPoint(
                 source="ebay_sold",
                 value=round(base_value * variance, 2),
-                date=datetime.now() - timedelta(days=i * 7),
+                date=now - i * _ONE_WEEK,
                 sample_size=3,
                 condition=card.condition,
-                url=f"https://ebay.com/itm/mock_{seed % 99999}",
+                url=f"https://ebay.com/itm/mock_{rng.randrange(99999)}",
                 notes=f"Sold {i * 7} days ago",
             ))
         
@@ -408,7 +578,7 @@ class MockDataFactory:
         points.append(MarketDataPoint(
             source="130point",
             value=round(base_value * 1.05, 2),
-            date=datetime.now() - timedelta(days=5),
+            date=now - _FIVE_DAYS,
             sample_size=15,
             condition=card.condition,
             url="https://130point.com/sales/mock",
@@ -419,7 +589,7 @@ class MockDataFactory:
             points.append(MarketDataPoint(
                 source="pwcc",
                 value=round(base_value * 1.2, 2),
-                date=datetime.now() - timedelta(days=10),
+                date=now - _TEN_DAYS,
                 sample_size=2,
                 condition=card.condition,
                 url="https://pwcc.com/mock",
@@ -429,7 +599,7 @@ class MockDataFactory:
         points.append(MarketDataPoint(
             source="comc",
             value=round(base_value * 0.95, 2),
-            date=datetime.now() - timedelta(days=3),
+            date=now - _THREE_DAYS,
             sample_size=8,
             condition=card.condition,
             url="https://comc.com/mock",
@@ -440,7 +610,7 @@ class MockDataFactory:
             points.append(MarketDataPoint(
                 source="psa_apr",
                 value=round(base_value * 2.0, 2),
-                date=datetime.now() - timedelta(days=30),
+                date=now - _THIRTY_DAYS,
                 sample_size=5,
                 condition=CardCondition.MINT,
                 notes="PSA 9 reference price",
@@ -496,7 +666,16 @@ class CardValueEstimator:
         "psa_apr": 0.07,
         "sportlots": 0.05,
     }
-    
+
+    DEFAULT_SOURCE_WEIGHT = 0.05
+
+    # Integer dispatch table: known sources get stable ids, and the last
+    # slot holds the default weight for anything unrecognized. The hot loop
+    # then buckets by small int instead of hashing source strings per group.
+    SOURCE_ORDER = tuple(SOURCE_WEIGHTS)
+    _SOURCE_INDEX = {s: i for i, s in enumerate(SOURCE_ORDER)}
+    _WEIGHT_TABLE = tuple(map(SOURCE_WEIGHTS.get, SOURCE_ORDER)) + (DEFAULT_SOURCE_WEIGHT,)
+
     def estimate_value(self, card: CardAttributes,
                        market_data: Optional[List[MarketDataPoint]] = None,
                        use_mock: bool = True) -> ValueEstimate:
@@ -504,34 +683,41 @@ class CardValueEstimator:
         if market_data is None:
             if use_mock:
                 market_data = MockDataFactory.generate(card)
+                # Data we just generated is mock by construction — no need
+                # to scan it for real comp URLs below.
+                has_real_data = False
             else:
                 raise ValueError("No market data provided and mock data disabled")
-        
+        else:
+            has_real_data = self._has_real_comps(market_data)
+
+        # SoA view built once and shared by the aggregation, confidence, and
+        # trend passes
+        arrays = MarketDataArrays.from_points(market_data)
+
         # 1. Weighted base value from market data
-        base_value = self._weighted_value(market_data)
-        
+        base_value = self._weighted_value(arrays)
+
         # 2. Apply multipliers ONLY for mock data.
         # Real sold comps already reflect grade/RC/parallel — multiplying again
         # causes massive inflation. Detect real data by checking for non-mock URLs.
-        has_real_data = any(
-            dp.url and "mock" not in str(dp.url)
-            for dp in market_data
-            if dp.source == "ebay_sold"
-        )
         if has_real_data:
-            adjusted_value = round(base_value, 2)
-            mult_breakdown = {"note": "multipliers skipped — real sold comp data"}
+            adjusted_value = base_value
+            mult_breakdown = dict(_REAL_COMP_BREAKDOWN)
         else:
             adjusted_value, mult_breakdown = MultiplierEngine.apply_all(base_value, card)
+        # Single rounding site for the headline value — intermediate math
+        # stays at full precision
+        adjusted_value = round(adjusted_value, 2)
         
         # 3. Confidence (refactored — extracted calculator)
-        confidence, score, factors = ConfidenceCalculator.calculate(card, market_data)
-        
+        confidence, score, factors = ConfidenceCalculator.calculate(card, market_data, arrays)
+
         # 4. Value range
         value_range = self._value_range(adjusted_value, score)
-        
+
         # 5. Market trends
-        trends = self._market_trends(market_data)
+        trends = self._market_trends(market_data, arrays)
         
         # 6. Grading recommendation
         grading_rec = self._grading_recommendation(card, adjusted_value)
@@ -547,30 +733,82 @@ class CardValueEstimator:
             accuracy_factors=factors,
             multipliers_applied=mult_breakdown,
         )
-    
-    def _weighted_value(self, market_data: List[MarketDataPoint]) -> float:
+
+    @staticmethod
+    def _has_real_comps(market_data: List[MarketDataPoint]) -> bool:
+        """True if any eBay point carries a real (non-mock) listing URL."""
+        for dp in market_data:
+            if dp.source == "ebay_sold" and dp.url and "mock" not in str(dp.url):
+                return True
+        return False
+
+    def _weighted_value(self, arrays: MarketDataArrays) -> float:
         """Weighted average from sources. Median per source to reduce outliers."""
-        if not market_data:
+        if not len(arrays):
             return 0.0
-        
-        source_groups: Dict[str, List[float]] = {}
-        for dp in market_data:
-            source_groups.setdefault(dp.source, []).append(dp.value)
-        
-        weighted_sum = 0.0
-        total_weight = 0.0
-        
-        for source, values in source_groups.items():
-            median = statistics.median(values)
-            base_weight = self.SOURCE_WEIGHTS.get(source, 0.05)
-            # Scale weight by sample size (more data = more trust)
-            adjusted_weight = base_weight * min(1.0, len(values) / 10)
-            weighted_sum += median * adjusted_weight
-            total_weight += adjusted_weight
-        
+
+        unknown_id = len(self.SOURCE_ORDER)
+        id_for = self._SOURCE_INDEX.get
+        weight_table = self._WEIGHT_TABLE
+        medians: List[float] = []
+        weights: List[float] = []
+        counts: List[int] = []
+
+        def close_run(source: str, run: List[float]) -> None:
+            medians.append(statistics.median(run))
+            weights.append(weight_table[id_for(source, unknown_id)])
+            # Sample size scales the weight inside the kernel (more data = more trust)
+            counts.append(len(run))
+
+        # Fast path: data normally arrives grouped by source (the mock factory
+        # and the eBay fetcher both emit contiguous per-source runs), so one
+        # sweep over the runs skips the bucketing table. Bail out if a source
+        # reappears after its run already closed.
+        grouped = True
+        seen = set()
+        run: List[float] = []
+        run_source: Optional[str] = None
+        for source, value in zip(arrays.sources, arrays.values):
+            if source != run_source:
+                if source in seen:
+                    grouped = False
+                    break
+                if run:
+                    close_run(run_source, run)
+                seen.add(source)
+                run_source = source
+                run = [value]
+            else:
+                run.append(value)
+        if grouped:
+            if run:
+                close_run(run_source, run)
+        else:
+            # Interleaved sources — bucket values by small int source id;
+            # unknown sources share the final slot of the dispatch table
+            medians.clear()
+            weights.clear()
+            counts.clear()
+            buckets: List[List[float]] = [[] for _ in range(unknown_id + 1)]
+            for source, value in zip(arrays.sources, arrays.values):
+                buckets[id_for(source, unknown_id)].append(value)
+            for sid, group in enumerate(buckets):
+                if group:
+                    medians.append(statistics.median(group))
+                    weights.append(weight_table[sid])
+                    counts.append(len(group))
+
+        if _np is not None:
+            medians = _np.asarray(medians)
+            weights = _np.asarray(weights)
+            counts = _np.asarray(counts, dtype=float)
+        weighted_sum, total_weight = _aggregate_weighted(medians, weights, counts)
+
         if total_weight == 0:
-            return statistics.mean([dp.value for dp in market_data])
-        
+            if _np is not None:
+                return float(arrays.values.mean())
+            return statistics.mean(arrays.values)
+
         return weighted_sum / total_weight
     
     def _value_range(self, value: float, confidence_score: float) -> Tuple[float, float]:
@@ -578,24 +816,21 @@ class CardValueEstimator:
         variance = max(0.05, 0.5 - (confidence_score / 200))
         return (round(value * (1 - variance), 2), round(value * (1 + variance), 2))
     
-    def _market_trends(self, market_data: List[MarketDataPoint]) -> Dict[str, Any]:
+    def _market_trends(self, market_data: List[MarketDataPoint],
+                       arrays: Optional[MarketDataArrays] = None) -> Dict[str, Any]:
         """Analyze trends from data points."""
-        trends = {
-            "direction": "stable",
-            "velocity": "normal",
-            "30_day_change": 0.0,
-            "90_day_change": 0.0,
-            "volatility": "low",
-            "recommendation": "hold",
-        }
-        
+        # Not enough data for trend analysis — bail before any sorting
         if len(market_data) < 3:
-            return trends
-        
-        sorted_data = sorted(market_data, key=lambda x: x.date)
-        recent = [dp.value for dp in sorted_data[-3:]]
-        older = [dp.value for dp in sorted_data[:3]]
-        
+            return dict(_DEFAULT_TRENDS)
+
+        trends = dict(_DEFAULT_TRENDS)
+
+        # Only the three newest / three oldest points matter — heap selection
+        # beats a full sort of the data set
+        date_of = attrgetter("date")
+        recent = [dp.value for dp in heapq.nlargest(3, market_data, key=date_of)]
+        older = [dp.value for dp in heapq.nsmallest(3, market_data, key=date_of)]
+
         recent_avg = statistics.mean(recent)
         older_avg = statistics.mean(older)
         
@@ -614,28 +849,36 @@ class CardValueEstimator:
         trends["30_day_change"] = round(change_pct / 2, 1)
         trends["90_day_change"] = round(change_pct, 1)
         
-        all_values = [dp.value for dp in sorted_data]
+        # Volatility is order-independent — use the SoA values directly
+        all_values = arrays.values if arrays is not None else [dp.value for dp in market_data]
         if len(all_values) > 1:
-            mean_val = statistics.mean(all_values)
+            if _np is not None and arrays is not None:
+                mean_val = float(all_values.mean())
+                stdev = float(all_values.std(ddof=1))
+            else:
+                mean_val, stdev = _mean_stdev(all_values)
             if mean_val > 0:
-                cv = statistics.stdev(all_values) / mean_val
+                cv = stdev / mean_val
                 trends["volatility"] = "high" if cv > 0.3 else ("medium" if cv > 0.15 else "low")
         
         return trends
     
+    # Value thresholds and the recommendation for each band — parallel
+    # sequences so the lookup is one bisect instead of a comparison chain
+    _GRADING_THRESHOLDS = (20, 50, 100, 500)
+    _GRADING_ADVICE = (
+        "Not worth grading unless gem mint condition",
+        "Consider grading if confident in 9+ grade",
+        "Grading recommended if NM+ or better",
+        "Definitely grade if NM or better",
+        "High value — professional grading essential",
+    )
+
     def _grading_recommendation(self, card: CardAttributes, value: float) -> Optional[str]:
         """Grade-or-not recommendation based on value threshold."""
         if card.graded:
             return None
-        if value < 20:
-            return "Not worth grading unless gem mint condition"
-        elif value < 50:
-            return "Consider grading if confident in 9+ grade"
-        elif value < 100:
-            return "Grading recommended if NM+ or better"
-        elif value < 500:
-            return "Definitely grade if NM or better"
-        return "High value — professional grading essential"
+        return self._GRADING_ADVICE[bisect_right(self._GRADING_THRESHOLDS, value)]
 
 
 # ============================================================================
@@ -643,8 +886,12 @@ class CardValueEstimator:
 # ============================================================================
 
 class AccuracyValidator:
+    # Keep enough history for a meaningful rolling accuracy figure without
+    # letting a long-running process grow the list unbounded
+    MAX_HISTORY = 1000
+
     def __init__(self):
-        self.history: List[Dict] = []
+        self.history: Deque[Dict] = deque(maxlen=self.MAX_HISTORY)
     
     def validate(self, estimate: ValueEstimate, actual_price: float) -> Dict[str, Any]:
         error = abs(estimate.estimated_value - actual_price)
@@ -6,14 +6,16 @@ Author: HutchGroup LLC
 """
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
-from typing import List, Optional, Dict, Any, Tuple
-from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Dict, Any, Tuple
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class Booklet:
     """Represents a physical booklet/binder in the collection."""
     id: Optional[int] = None
@@ -22,7 +24,12 @@ class Booklet:
     sport: str = ""  # Can pre-set sport for all cards in booklet
     total_pages: int = 0
     created_at: str = ""
-    
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Booklet":
+        """Build a Booklet positionally from a query row (no intermediate dict)."""
+        return cls(*map(row.__getitem__, _BOOKLET_FIELDS))
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -34,7 +41,7 @@ class Booklet:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PageScan:
     """Represents a scanned page from a booklet."""
     id: Optional[int] = None
@@ -44,7 +51,12 @@ class PageScan:
     original_image_path: str = ""
     scan_date: str = ""
     notes: str = ""
-    
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "PageScan":
+        """Build a PageScan positionally from a query row (no intermediate dict)."""
+        return cls(*map(row.__getitem__, _PAGE_SCAN_FIELDS))
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -57,7 +69,7 @@ class PageScan:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     """Represents a card in the collection with full location tracking."""
     id: Optional[int] = None
@@ -99,9 +111,10 @@ class Card:
     slot_row: int = 0  # 0-2
     slot_col: int = 0  # 0-2
     
-    # Image
+    # Image — always a filesystem path, never raw bytes (see the Path
+    # adapter registered below)
     image_path: str = ""
-    
+
     # Optional tracking
     condition: str = ""
     estimated_value: float = 0.0
@@ -122,7 +135,12 @@ class Card:
     # Metadata
     created_at: str = ""
     updated_at: str = ""
-    
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "Card":
+        """Build a Card from a _SELECT_CARDS row (columns in field order)."""
+        return cls(*row)
+
     def get_location_string(self) -> str:
         """Get human-readable location string."""
         if self.booklet_name and self.page_number:
@@ -218,20 +236,168 @@ class Card:
         return " ".join(parts) if parts else "Unknown Card"
 
 
+# Field-name tuples in declaration order, used by the from_row() constructors
+# to index rows by name but build instances positionally.
+_BOOKLET_FIELDS = tuple(f.name for f in fields(Booklet))
+_PAGE_SCAN_FIELDS = tuple(f.name for f in fields(PageScan))
+_CARD_FIELDS = tuple(f.name for f in fields(Card))
+
+# Explicit card projection in Card field order. ALTER TABLE appends migrated
+# columns after created_at/updated_at, so SELECT * order depends on migration
+# history — the explicit list keeps rows aligned with Card.from_row().
+# booklet_name is not stored on cards; it is derived here by joining
+# booklets on its indexed primary key.
+_SELECT_CARDS = "SELECT " + ", ".join(
+    "COALESCE(b.name, '') AS booklet_name" if f == "booklet_name" else f"c.{f}"
+    for f in _CARD_FIELDS
+) + " FROM cards c LEFT JOIN booklets b ON c.booklet_id = b.id"
+
+# CSV export projection: exactly the exported columns, in header order.
+# booklet_name and the human-readable location are composed in SQL so the
+# export path never builds Card objects or per-row dicts — rows go from
+# the cursor straight into csv.writer.
+_EXPORT_COLUMNS = (
+    'id', 'player_name', 'team', 'year', 'sport', 'position',
+    'brand', 'set_name', 'subset', 'card_number', 'parallel',
+    'is_rookie', 'is_auto', 'is_patch', 'is_memorabilia',
+    'is_numbered', 'numbering', 'is_ssp', 'ssp_type',
+    'confidence', 'booklet_name', 'page_number', 'slot_position',
+    'location', 'condition', 'estimated_value', 'notes'
+)
+_EXPORT_SQL_EXPRS = {
+    "booklet_name": "COALESCE(b.name, '') AS booklet_name",
+    # Mirrors Card.get_location_string(): booklet + page set → composed
+    # string, otherwise the placeholder.
+    "location": (
+        "CASE WHEN COALESCE(b.name, '') != '' AND c.page_number > 0 "
+        "THEN b.name || ', Page ' || c.page_number || ', Slot ' || COALESCE(c.slot_position, 0) "
+        "ELSE 'Location not set' END AS location"
+    ),
+}
+_EXPORT_SELECT = "SELECT " + ", ".join(
+    _EXPORT_SQL_EXPRS.get(col, f"c.{col}") for col in _EXPORT_COLUMNS
+) + " FROM cards c LEFT JOIN booklets b ON c.booklet_id = b.id"
+
+# Images are stored on disk and referenced by path — never as BLOBs, which
+# would drag whole images through SQLite's page cache and Python memory.
+# The adapter keeps that contract when a caller binds a pathlib.Path for
+# image_path: it serializes as TEXT instead of raising ProgrammingError.
+# (Path() yields the platform-concrete subclass sqlite3 keys adapters on.)
+sqlite3.register_adapter(type(Path()), str)
+
+
 class CardDatabase:
     """
     Enhanced SQLite database manager with booklet tracking.
+
+    Connections are persistent and per-thread: each thread lazily opens one
+    WAL-tuned connection (see _PRAGMAS) with a 256-entry statement cache and
+    reuses it for every call. Methods never open or close connections
+    themselves; call close() to release the calling thread's connection.
     """
     
+    # Connection tuning applied to every connection. journal_mode=WAL is
+    # persisted in the database file but cheap to reassert; the others are
+    # per-connection settings so they have to be set on each connect.
+    _PRAGMAS = (
+        ("journal_mode", "WAL"),    # readers no longer block the writer
+        ("synchronous", "NORMAL"),  # safe under WAL, far fewer fsyncs
+        ("cache_size", -8192),      # 8 MB page cache
+        ("temp_store", "MEMORY"),   # sort/temp b-trees in RAM
+    )
+
+    # Stored in PRAGMA user_version once the schema (including the value
+    # engine column migration) is in place. Bump whenever _init_db's DDL or
+    # migration steps change so existing databases re-run them.
+    SCHEMA_VERSION = 3
+
     def __init__(self, db_path: str = "card_collection.db"):
         self.db_path = db_path
+        self._local = threading.local()
+        # Monotonic write counter + memoized stats keyed on it; any
+        # committed write invalidates (see _write_tx).
+        self._stats_version = 0
+        self._stats_cache: Optional[Tuple[int, Dict[str, Any]]] = None
         self._init_db()
-    
+
+    def _connect(self, row_factory: bool = False) -> sqlite3.Connection:
+        """Open a tuned connection to the collection database."""
+        # isolation_level=None disables the stdlib's implicit transaction
+        # management — transactions are opened explicitly via _write_tx.
+        # sqlite3 keeps compiled statements in a per-connection cache keyed
+        # on the exact SQL text; a larger cache plus the constant SQL strings
+        # used throughout this class means steady-state calls skip the
+        # prepare/parse step entirely.
+        conn = sqlite3.connect(self.db_path, isolation_level=None,
+                               cached_statements=256)
+        if row_factory:
+            conn.row_factory = sqlite3.Row
+        for name, value in self._PRAGMAS:
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
+    def _conn(self) -> sqlite3.Connection:
+        """
+        Cached per-thread connection. Opening a SQLite connection on every
+        call re-reads the schema and re-applies PRAGMAs; reusing one per
+        thread (Flask serves requests from a thread pool) removes that cost
+        while staying within sqlite3's same-thread rule.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect(row_factory=True)
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _write_tx(self):
+        """
+        Write transaction opened with BEGIN IMMEDIATE.
+
+        Taking the write lock up front means the transaction never has to
+        upgrade from a read lock mid-flight — the classic way concurrent
+        writers end up with SQLITE_BUSY under deferred transactions.
+        """
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        conn.commit()
+        # Every write funnels through here, so this is the one place that
+        # needs to invalidate derived caches.
+        self._stats_version += 1
+        self._stats_cache = None
+
+    def close(self):
+        """Close the calling thread's cached connection, if any."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            # SQLite's recommended pre-close idiom: refresh any stale planner
+            # stats cheaply so the next connection starts with good plans.
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.OperationalError:
+                pass
+            conn.close()
+            self._local.conn = None
+
     def _init_db(self):
         """Initialize the database schema."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._conn()
         cursor = conn.cursor()
-        
+
+        if cursor.execute("PRAGMA user_version").fetchone()[0] >= self.SCHEMA_VERSION:
+            # Schema already current — skip the DDL and the per-column
+            # table_info migration probes; just detect whether the FTS
+            # index exists on this build.
+            self._fts_enabled = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'cards_fts'"
+            ).fetchone() is not None
+            return
+
         # Booklets table - physical binders/booklets
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS booklets (
@@ -293,7 +459,6 @@ class CardDatabase:
                 
                 -- Physical Location
                 booklet_id INTEGER,
-                booklet_name TEXT,
                 page_id INTEGER,
                 page_number INTEGER,
                 slot_position INTEGER,
@@ -319,18 +484,34 @@ class CardDatabase:
             )
         """)
         
-        # Create indexes for common searches
+        # Indexes matched to how search_cards actually filters and sorts.
+        # Single-column indexes on the boolean attribute flags are dead
+        # weight: they are far too low-cardinality for the planner to prefer
+        # over a scan, but every insert still had to maintain all four.
+        cursor.execute("DROP INDEX IF EXISTS idx_cards_rookie")
+        cursor.execute("DROP INDEX IF EXISTS idx_cards_auto")
+        cursor.execute("DROP INDEX IF EXISTS idx_cards_patch")
+        cursor.execute("DROP INDEX IF EXISTS idx_cards_ssp")
+        cursor.execute("DROP INDEX IF EXISTS idx_cards_booklet")
+        # booklet_name no longer lives on cards (see v3 migration below)
+        cursor.execute("DROP INDEX IF EXISTS idx_cards_booklet_name")
+
+        # Sort-order and equality helpers. idx_cards_player and
+        # idx_cards_team also serve the stats top-N GROUP BYs as covering
+        # indexes (index-only scan, no temp b-tree, main table untouched).
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_player ON cards(player_name)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_team ON cards(team)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_year ON cards(year)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_set ON cards(set_name)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_sport ON cards(sport)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_rookie ON cards(is_rookie)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_auto ON cards(is_auto)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_patch ON cards(is_patch)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_ssp ON cards(is_ssp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_booklet ON cards(booklet_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_booklet_name ON cards(booklet_name)")
+        # Collection view sorts by newest first
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cards_created ON cards(created_at)")
+        # Composite covers the booklet/page lookups: filter on booklet_id,
+        # order by page_number then slot_position without a separate sort
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_cards_booklet_page
+            ON cards(booklet_id, page_number, slot_position)
+        """)
         
         # === MIGRATION: Value engine columns (safe — only adds if missing) ===
         # These columns support the v3.0 value engine integration
@@ -348,6 +529,18 @@ class CardDatabase:
         for col_name, col_type in _new_cols:
             if col_name not in existing:
                 cursor.execute(f"ALTER TABLE cards ADD COLUMN {col_name} {col_type}")
+
+        # === MIGRATION: booklet_name is derived, not stored (v3) ===
+        # Reads join booklets on the indexed primary key instead, so renames
+        # no longer cascade over every card. The FTS objects reference the
+        # column and must go first; the block below recreates and rebuilds
+        # them without it.
+        if "booklet_name" in existing:
+            cursor.execute("DROP TRIGGER IF EXISTS cards_fts_ai")
+            cursor.execute("DROP TRIGGER IF EXISTS cards_fts_ad")
+            cursor.execute("DROP TRIGGER IF EXISTS cards_fts_au")
+            cursor.execute("DROP TABLE IF EXISTS cards_fts")
+            cursor.execute("ALTER TABLE cards DROP COLUMN booklet_name")
         
         # Value history table — tracks re-valuations over time
         cursor.execute("""
@@ -360,71 +553,128 @@ class CardDatabase:
                 FOREIGN KEY (card_id) REFERENCES cards(id)
             )
         """)
-        
+
+        # Full-text index over the search text columns. Leading-% LIKE filters
+        # can't use the b-tree indexes and scan the whole table; FTS5 turns
+        # those into index probes. External-content table keeps text stored
+        # once, with triggers maintaining the index on writes.
+        self._fts_enabled = True
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5(
+                    player_name, team, set_name, brand,
+                    content='cards', content_rowid='id'
+                )
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS cards_fts_ai AFTER INSERT ON cards BEGIN
+                    INSERT INTO cards_fts(rowid, player_name, team, set_name, brand)
+                    VALUES (new.id, new.player_name, new.team, new.set_name, new.brand);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS cards_fts_ad AFTER DELETE ON cards BEGIN
+                    INSERT INTO cards_fts(cards_fts, rowid, player_name, team, set_name, brand)
+                    VALUES ('delete', old.id, old.player_name, old.team, old.set_name, old.brand);
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS cards_fts_au AFTER UPDATE ON cards BEGIN
+                    INSERT INTO cards_fts(cards_fts, rowid, player_name, team, set_name, brand)
+                    VALUES ('delete', old.id, old.player_name, old.team, old.set_name, old.brand);
+                    INSERT INTO cards_fts(rowid, player_name, team, set_name, brand)
+                    VALUES (new.id, new.player_name, new.team, new.set_name, new.brand);
+                END
+            """)
+            # (Re)build the index from the content table. count(*) on an
+            # external-content table reads the content table, so an empty
+            # index can't be detected that way — and this DDL path only runs
+            # on first build or a schema version bump, so the rebuild is a
+            # one-time cost.
+            cursor.execute("INSERT INTO cards_fts(cards_fts) VALUES ('rebuild')")
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5 — searches fall back to LIKE scans
+            self._fts_enabled = False
+
+        # Seed planner statistics so index choices are informed from the
+        # first query rather than after the dataset crosses some threshold.
+        cursor.execute("ANALYZE")
+
+        cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
         conn.commit()
-        conn.close()
+
+    @staticmethod
+    def _fts_match(column: str, text: str) -> str:
+        """Build a column-scoped FTS5 prefix query from user search text.
+
+        The token list is parenthesized because an FTS5 column filter scopes
+        only the next phrase — without parens every token after the first
+        would match against any indexed column.
+        """
+        tokens = [t.replace('"', '""') for t in text.split()]
+        return f"{column}: (" + " ".join(f'"{t}"*' for t in tokens if t) + ")"
     
     # ==================== BOOKLET OPERATIONS ====================
     
     def create_booklet(self, name: str, description: str = "", sport: str = "") -> int:
         """Create a new booklet/binder."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute("""
-                INSERT INTO booklets (name, description, sport)
-                VALUES (?, ?, ?)
-            """, (name, description, sport))
-            booklet_id = cursor.lastrowid
-            conn.commit()
-            return booklet_id
+            with self._write_tx() as conn:
+                cursor = conn.execute("""
+                    INSERT INTO booklets (name, description, sport)
+                    VALUES (?, ?, ?)
+                """, (name, description, sport))
+                return cursor.lastrowid
         except sqlite3.IntegrityError:
             # Booklet already exists, return existing ID
-            cursor.execute("SELECT id FROM booklets WHERE name = ?", (name,))
+            cursor = self._conn().execute("SELECT id FROM booklets WHERE name = ?", (name,))
             return cursor.fetchone()[0]
-        finally:
-            conn.close()
     
     def get_booklet(self, booklet_id: int) -> Optional[Booklet]:
         """Get a booklet by ID."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
         
         cursor.execute("SELECT * FROM booklets WHERE id = ?", (booklet_id,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
-            return Booklet(**dict(row))
+            return Booklet.from_row(row)
         return None
     
     def get_booklet_by_name(self, name: str) -> Optional[Booklet]:
         """Get a booklet by name."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
         
         cursor.execute("SELECT * FROM booklets WHERE name = ?", (name,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
-            return Booklet(**dict(row))
+            return Booklet.from_row(row)
         return None
     
     def get_or_create_booklet(self, name: str, description: str = "", sport: str = "") -> Tuple[int, bool]:
         """Get existing booklet or create new one. Returns (id, was_created)."""
-        existing = self.get_booklet_by_name(name)
-        if existing:
-            return existing.id, False
-        return self.create_booklet(name, description, sport), True
+        # Single UPSERT instead of SELECT-then-INSERT: no race between the
+        # existence check and the insert, and the common create case is one
+        # statement. RETURNING yields a row only when the insert happened.
+        with self._write_tx() as conn:
+            cursor = conn.execute("""
+                INSERT INTO booklets (name, description, sport)
+                VALUES (?, ?, ?)
+                ON CONFLICT(name) DO NOTHING
+                RETURNING id
+            """, (name, description, sport))
+            row = cursor.fetchone()
+            if row:
+                return row[0], True
+            cursor = conn.execute("SELECT id FROM booklets WHERE name = ?", (name,))
+            return cursor.fetchone()[0], False
     
     def list_booklets(self) -> List[Booklet]:
         """List all booklets."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -437,18 +687,14 @@ class CardDatabase:
         
         booklets = []
         for row in cursor.fetchall():
-            b = Booklet(**{k: row[k] for k in ['id', 'name', 'description', 'sport', 'total_pages', 'created_at']})
+            b = Booklet.from_row(row)
             b.total_pages = row['max_page'] or 0
             booklets.append(b)
         
-        conn.close()
         return booklets
     
     def update_booklet(self, booklet_id: int, name: str = None, description: str = None, sport: str = None) -> bool:
         """Update a booklet's details."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         updates = []
         params = []
         
@@ -466,51 +712,38 @@ class CardDatabase:
             return False
         
         params.append(booklet_id)
-        cursor.execute(f"UPDATE booklets SET {', '.join(updates)} WHERE id = ?", params)
-        
-        # Also update booklet_name in cards if name changed
-        if name is not None:
-            cursor.execute("UPDATE cards SET booklet_name = ? WHERE booklet_id = ?", (name, booklet_id))
-        
-        conn.commit()
-        conn.close()
-        return True
+        with self._write_tx() as conn:
+            cursor = conn.execute(f"UPDATE booklets SET {', '.join(updates)} WHERE id = ?", params)
+            changed = cursor.rowcount > 0
+        return changed
     
     # ==================== PAGE SCAN OPERATIONS ====================
     
     def add_page_scan(self, booklet_id: int, page_number: int, image_path: str, notes: str = "") -> int:
         """Add a page scan record."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute("""
-                INSERT INTO page_scans (booklet_id, page_number, original_image_path, notes)
-                VALUES (?, ?, ?, ?)
-            """, (booklet_id, page_number, image_path, notes))
-            page_id = cursor.lastrowid
-            conn.commit()
-            return page_id
+            with self._write_tx() as conn:
+                cursor = conn.execute("""
+                    INSERT INTO page_scans (booklet_id, page_number, original_image_path, notes)
+                    VALUES (?, ?, ?, ?)
+                """, (booklet_id, page_number, image_path, notes))
+                return cursor.lastrowid
         except sqlite3.IntegrityError:
             # Page already exists, update it
-            cursor.execute("""
-                UPDATE page_scans 
-                SET original_image_path = ?, notes = ?, scan_date = CURRENT_TIMESTAMP
-                WHERE booklet_id = ? AND page_number = ?
-            """, (image_path, notes, booklet_id, page_number))
-            cursor.execute("""
-                SELECT id FROM page_scans WHERE booklet_id = ? AND page_number = ?
-            """, (booklet_id, page_number))
-            page_id = cursor.fetchone()[0]
-            conn.commit()
-            return page_id
-        finally:
-            conn.close()
+            with self._write_tx() as conn:
+                conn.execute("""
+                    UPDATE page_scans 
+                    SET original_image_path = ?, notes = ?, scan_date = CURRENT_TIMESTAMP
+                    WHERE booklet_id = ? AND page_number = ?
+                """, (image_path, notes, booklet_id, page_number))
+                cursor = conn.execute("""
+                    SELECT id FROM page_scans WHERE booklet_id = ? AND page_number = ?
+                """, (booklet_id, page_number))
+                return cursor.fetchone()[0]
     
     def get_page_scan(self, booklet_id: int, page_number: int) -> Optional[PageScan]:
         """Get a page scan by booklet and page number."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -521,70 +754,128 @@ class CardDatabase:
         """, (booklet_id, page_number))
         
         row = cursor.fetchone()
-        conn.close()
         
         if row:
-            return PageScan(**dict(row))
+            return PageScan.from_row(row)
         return None
     
     # ==================== CARD OPERATIONS ====================
-    
-    def add_card(self, card: Card) -> int:
-        """Add a card to the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        now = datetime.now().isoformat()
-        
-        cursor.execute("""
-            INSERT INTO cards (
-                player_name, team, year, sport, position,
-                brand, set_name, subset, card_number, parallel,
-                is_rookie, is_auto, is_patch, is_memorabilia, is_numbered, numbering, is_ssp, ssp_type,
-                confidence, identification_notes,
-                booklet_id, booklet_name, page_id, page_number, slot_position, slot_row, slot_col,
-                image_path, condition, estimated_value, purchase_price, purchase_date, notes,
-                created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+
+    _INSERT_CARD_COLS = (
+        "player_name", "team", "year", "sport", "position",
+        "brand", "set_name", "subset", "card_number", "parallel",
+        "is_rookie", "is_auto", "is_patch", "is_memorabilia", "is_numbered",
+        "numbering", "is_ssp", "ssp_type",
+        "confidence", "identification_notes",
+        "booklet_id", "page_id", "page_number", "slot_position", "slot_row", "slot_col",
+        "image_path", "condition", "estimated_value", "purchase_price", "purchase_date", "notes",
+    )
+    _INSERT_GROUP = "(" + ", ".join("?" * len(_INSERT_CARD_COLS)) + ")"
+    _INSERT_CARD_SQL = (
+        f"INSERT INTO cards ({', '.join(_INSERT_CARD_COLS)}) VALUES {_INSERT_GROUP}"
+    )
+    # Rows per multi-row INSERT: SQLite's bind-parameter ceiling is 32766,
+    # so each statement must stay under 32766 / column-count rows.
+    _BULK_CHUNK_ROWS = min(5000, 32766 // len(_INSERT_CARD_COLS))
+
+    @staticmethod
+    def _insert_params(card: Card) -> Tuple:
+        """Parameter tuple for _INSERT_CARD_SQL, shared by single and bulk adds.
+
+        created_at/updated_at are left to their CURRENT_TIMESTAMP column
+        defaults, matching the booklets and page_scans tables.
+        """
+        return (
             card.player_name, card.team, card.year, card.sport, card.position,
             card.brand, card.set_name, card.subset, card.card_number, card.parallel,
-            card.is_rookie, card.is_auto, card.is_patch, card.is_memorabilia, 
+            card.is_rookie, card.is_auto, card.is_patch, card.is_memorabilia,
             card.is_numbered, card.numbering, card.is_ssp, card.ssp_type,
             card.confidence, card.identification_notes,
-            card.booklet_id, card.booklet_name, card.page_id, card.page_number,
+            card.booklet_id, card.page_id, card.page_number,
             card.slot_position, card.slot_row, card.slot_col,
-            card.image_path, card.condition, card.estimated_value, 
+            card.image_path, card.condition, card.estimated_value,
             card.purchase_price, card.purchase_date, card.notes,
-            now, now
-        ))
-        
-        card_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
-        
-        return card_id
+        )
+
+    def add_card(self, card: Card) -> int:
+        """Add a card to the database."""
+        with self._write_tx() as conn:
+            cursor = conn.execute(self._INSERT_CARD_SQL, self._insert_params(card))
+            return cursor.lastrowid
+
+    def add_cards(self, cards: List[Card]) -> int:
+        """
+        Add many cards in one transaction via executemany.
+
+        A full page scan inserts up to nine cards; committing each insert
+        separately costs one fsync per card. The bulk path pays a single
+        commit for the lot. Returns the number of cards inserted — use
+        add_card when the new row id is needed.
+        """
+        if not cards:
+            return 0
+
+        with self._write_tx() as conn:
+            conn.executemany(
+                self._INSERT_CARD_SQL,
+                [self._insert_params(card) for card in cards],
+            )
+        if len(cards) > 1000:
+            # A load this size can shift value distributions enough to stale
+            # the planner stats — refresh them once the transaction is done.
+            self._conn().execute("ANALYZE cards")
+        return len(cards)
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _bulk_insert_sql(cls, row_count: int) -> str:
+        """Multi-row variant of _INSERT_CARD_SQL with row_count value groups."""
+        groups = ", ".join([cls._INSERT_GROUP] * row_count)
+        return f"INSERT INTO cards ({', '.join(cls._INSERT_CARD_COLS)}) VALUES {groups}"
+
+    def bulk_import_cards(self, cards: List[Card]) -> int:
+        """
+        Import a whole collection in multi-row INSERT chunks.
+
+        executemany (add_cards) still steps the statement once per row;
+        packing ~1000 rows into a single INSERT ... VALUES (...), (...)
+        executes one statement per chunk, which is the faster shape for
+        initial imports. All chunks commit under one transaction. Returns
+        the number of cards inserted.
+        """
+        if not cards:
+            return 0
+
+        chunk = self._BULK_CHUNK_ROWS
+        with self._write_tx() as conn:
+            for start in range(0, len(cards), chunk):
+                batch = cards[start:start + chunk]
+                flat = []
+                for card in batch:
+                    flat.extend(self._insert_params(card))
+                conn.execute(self._bulk_insert_sql(len(batch)), flat)
+        if len(cards) > 1000:
+            self._conn().execute("ANALYZE cards")
+        return len(cards)
     
     def update_card(self, card: Card) -> bool:
         """Update an existing card."""
         if card.id is None:
             return False
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
+        with self._write_tx() as conn:
+            conn.execute("""
             UPDATE cards SET
                 player_name = ?, team = ?, year = ?, sport = ?, position = ?,
                 brand = ?, set_name = ?, subset = ?, card_number = ?, parallel = ?,
                 is_rookie = ?, is_auto = ?, is_patch = ?, is_memorabilia = ?,
                 is_numbered = ?, numbering = ?, is_ssp = ?, ssp_type = ?,
                 confidence = ?, identification_notes = ?,
-                booklet_id = ?, booklet_name = ?, page_id = ?, page_number = ?,
+                booklet_id = ?, page_id = ?, page_number = ?,
                 slot_position = ?, slot_row = ?, slot_col = ?,
                 image_path = ?, condition = ?, estimated_value = ?,
                 purchase_price = ?, purchase_date = ?, notes = ?,
-                updated_at = ?
+                updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
         """, (
             card.player_name, card.team, card.year, card.sport, card.position,
@@ -592,41 +883,40 @@ class CardDatabase:
             card.is_rookie, card.is_auto, card.is_patch, card.is_memorabilia,
             card.is_numbered, card.numbering, card.is_ssp, card.ssp_type,
             card.confidence, card.identification_notes,
-            card.booklet_id, card.booklet_name, card.page_id, card.page_number,
+            card.booklet_id, card.page_id, card.page_number,
             card.slot_position, card.slot_row, card.slot_col,
             card.image_path, card.condition, card.estimated_value,
             card.purchase_price, card.purchase_date, card.notes,
-            datetime.now().isoformat(), card.id
-        ))
-        
-        conn.commit()
-        conn.close()
+            card.id
+            ))
         return True
     
     def get_card(self, card_id: int) -> Optional[Card]:
         """Get a card by ID."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
         
-        cursor.execute("SELECT * FROM cards WHERE id = ?", (card_id,))
+        cursor.execute(f"{_SELECT_CARDS} WHERE c.id = ?", (card_id,))
         row = cursor.fetchone()
-        conn.close()
         
         if row:
-            return Card(**dict(row))
+            return Card.from_row(row)
         return None
     
     def delete_card(self, card_id: int) -> bool:
         """Delete a card from the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM cards WHERE id = ?", (card_id,))
-        conn.commit()
-        conn.close()
+        with self._write_tx() as conn:
+            conn.execute("DELETE FROM cards WHERE id = ?", (card_id,))
         return True
     
-    def search_cards(
+    def search_cards(self, **filters) -> List[Card]:
+        """
+        Search cards with various filters (see iter_cards for the full set).
+        This is the main search function that supports all the required queries.
+        """
+        return list(self.iter_cards(**filters))
+
+    def iter_cards(
         self,
         # Text search
         player: Optional[str] = None,
@@ -654,224 +944,333 @@ class CardDatabase:
         sort_order: str = "ASC",
         limit: int = 100,
         offset: int = 0
-    ) -> List[Card]:
+    ) -> Iterator[Card]:
         """
-        Search cards with various filters.
-        This is the main search function that supports all the required queries.
+        Stream cards matching the given filters straight off the cursor.
+        Yields one Card at a time, so peak memory stays flat no matter how
+        large the result set — search_cards() wraps this when a list is needed.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
-        
+
+        conditions, params = self._filter_conditions(
+            player=player, team=team, year=year, set_name=set_name,
+            sport=sport, brand=brand, parallel=parallel,
+            booklet_name=booklet_name, booklet_id=booklet_id,
+            rookies_only=rookies_only, autos_only=autos_only,
+            patches_only=patches_only, memorabilia_only=memorabilia_only,
+            numbered_only=numbered_only, ssp_only=ssp_only,
+        )
+
+        if sort_by not in self._SORT_COLUMNS:
+            sort_by = "player_name"
+        sort_order = "DESC" if sort_order.upper() == "DESC" else "ASC"
+
+        sql = self._compose_search_sql(tuple(conditions), self._SORT_SQL[sort_by], sort_order)
+        cursor.execute(sql, params + [limit, offset])
+
+        for row in cursor:
+            yield Card.from_row(row)
+
+    def _filter_conditions(
+        self,
+        player: Optional[str] = None,
+        team: Optional[str] = None,
+        year: Optional[str] = None,
+        set_name: Optional[str] = None,
+        sport: Optional[str] = None,
+        brand: Optional[str] = None,
+        parallel: Optional[str] = None,
+        booklet_name: Optional[str] = None,
+        booklet_id: Optional[int] = None,
+        rookies_only: bool = False,
+        autos_only: bool = False,
+        patches_only: bool = False,
+        memorabilia_only: bool = False,
+        numbered_only: bool = False,
+        ssp_only: bool = False,
+    ) -> Tuple[List[str], List[Any]]:
+        """
+        Build the WHERE fragments for a filter set. Shared by iter_cards and
+        count_cards so both paths emit identical SQL snippets — repeated
+        filter shapes then hit sqlite3's statement cache on either path.
+        Conditions are qualified with the `c` alias used by _SELECT_CARDS
+        and work equally against a bare `FROM cards c`.
+        """
         conditions = []
         params = []
-        
-        # Text searches (LIKE for partial matching)
+
+        def add_text_filter(column: str, text: str) -> None:
+            """Word-prefix match via FTS5 when available, LIKE scan otherwise."""
+            match = self._fts_match(column, text) if self._fts_enabled else ""
+            if match.endswith(": ()"):
+                match = ""  # no usable tokens — fall through to LIKE
+            if match:
+                conditions.append("c.id IN (SELECT rowid FROM cards_fts WHERE cards_fts MATCH ?)")
+                params.append(match)
+            else:
+                conditions.append(f"c.{column} LIKE ?")
+                params.append(f"%{text}%")
+
+        # Text searches — indexed columns go through the full-text index
         if player:
-            conditions.append("player_name LIKE ?")
-            params.append(f"%{player}%")
+            add_text_filter("player_name", player)
         if team:
-            conditions.append("team LIKE ?")
-            params.append(f"%{team}%")
+            add_text_filter("team", team)
         if year:
-            conditions.append("year LIKE ?")
+            conditions.append("c.year LIKE ?")
             params.append(f"%{year}%")
         if set_name:
-            conditions.append("set_name LIKE ?")
-            params.append(f"%{set_name}%")
+            add_text_filter("set_name", set_name)
         if sport:
-            conditions.append("sport LIKE ?")
+            conditions.append("c.sport LIKE ?")
             params.append(f"%{sport}%")
         if brand:
-            conditions.append("brand LIKE ?")
-            params.append(f"%{brand}%")
+            add_text_filter("brand", brand)
         if parallel:
-            conditions.append("parallel LIKE ?")
+            conditions.append("c.parallel LIKE ?")
             params.append(f"%{parallel}%")
-        
+
         # Location searches
         if booklet_name:
-            conditions.append("booklet_name LIKE ?")
+            # Booklet names live on the (small) booklets table now; a LIKE
+            # probe there replaces the old denormalized-column filter.
+            conditions.append("c.booklet_id IN (SELECT id FROM booklets WHERE name LIKE ?)")
             params.append(f"%{booklet_name}%")
         if booklet_id:
-            conditions.append("booklet_id = ?")
+            conditions.append("c.booklet_id = ?")
             params.append(booklet_id)
-        
+
         # Attribute filters
         if rookies_only:
-            conditions.append("is_rookie = 1")
+            conditions.append("c.is_rookie = 1")
         if autos_only:
-            conditions.append("is_auto = 1")
+            conditions.append("c.is_auto = 1")
         if patches_only:
-            conditions.append("is_patch = 1")
+            conditions.append("c.is_patch = 1")
         if memorabilia_only:
-            conditions.append("(is_patch = 1 OR is_memorabilia = 1)")
+            conditions.append("(c.is_patch = 1 OR c.is_memorabilia = 1)")
         if numbered_only:
-            conditions.append("is_numbered = 1")
+            conditions.append("c.is_numbered = 1")
         if ssp_only:
-            conditions.append("is_ssp = 1")
-        
+            conditions.append("c.is_ssp = 1")
+
+        return conditions, params
+
+    # Whitelist of sortable columns mapped to their ORDER BY form — only
+    # these ever reach the SQL string. Table columns are qualified with c.
+    # (created_at exists on both sides of the booklets LEFT JOIN);
+    # booklet_name stays bare because it's a SELECT alias, not a column.
+    _SORT_SQL = {
+        "player_name": "c.player_name",
+        "team": "c.team",
+        "year": "c.year",
+        "set_name": "c.set_name",
+        "created_at": "c.created_at",
+        "booklet_name": "booklet_name",
+        "page_number": "c.page_number",
+        "confidence": "c.confidence",
+    }
+    _SORT_COLUMNS = frozenset(_SORT_SQL)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _compose_search_sql(conditions: Tuple[str, ...], sort_by: str, sort_order: str) -> str:
+        """
+        Assemble the search SQL for a given condition/sort combination.
+
+        The condition snippets and sort columns come from finite static sets,
+        so the cache converges on a small number of identical SQL strings —
+        which in turn lets sqlite3's cached_statements pool reuse the compiled
+        plan instead of re-parsing per query.
+        """
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        
-        # Validate sort column
-        valid_sorts = ["player_name", "team", "year", "set_name", "created_at", 
-                       "booklet_name", "page_number", "confidence"]
-        if sort_by not in valid_sorts:
-            sort_by = "player_name"
-        
-        sort_order = "DESC" if sort_order.upper() == "DESC" else "ASC"
-        
-        cursor.execute(f"""
-            SELECT * FROM cards 
-            WHERE {where_clause}
-            ORDER BY {sort_by} {sort_order}
-            LIMIT ? OFFSET ?
-        """, params + [limit, offset])
-        
-        cards = [Card(**dict(row)) for row in cursor.fetchall()]
-        conn.close()
-        
-        return cards
-    
-    def count_cards(self, **kwargs) -> int:
-        """Count cards matching search criteria."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        conditions = []
-        params = []
-        
-        for key, value in kwargs.items():
-            if value is not None and value is not False:
-                if key in ['rookies_only', 'autos_only', 'patches_only', 'numbered_only', 'ssp_only']:
-                    field_map = {
-                        'rookies_only': 'is_rookie',
-                        'autos_only': 'is_auto',
-                        'patches_only': 'is_patch',
-                        'numbered_only': 'is_numbered',
-                        'ssp_only': 'is_ssp'
-                    }
-                    conditions.append(f"{field_map[key]} = 1")
-                elif key in ['player', 'team', 'year', 'set_name', 'sport', 'booklet_name']:
-                    conditions.append(f"{key if key != 'player' else 'player_name'} LIKE ?")
-                    params.append(f"%{value}%")
-        
+        return (
+            f"{_SELECT_CARDS} WHERE {where_clause} "
+            f"ORDER BY {sort_by} {sort_order} LIMIT ? OFFSET ?"
+        )
+
+    def count_cards(self, **filters) -> int:
+        """Count cards matching search_cards() filters."""
+        conditions, params = self._filter_conditions(**filters)
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        cursor.execute(f"SELECT COUNT(*) FROM cards WHERE {where_clause}", params)
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count
-    
+        cursor = self._conn().execute(
+            f"SELECT COUNT(*) FROM cards c WHERE {where_clause}", params
+        )
+        return cursor.fetchone()[0]
+
     def get_cards_by_booklet(self, booklet_id: int) -> List[Card]:
         """Get all cards in a booklet, organized by page."""
-        return self.search_cards(booklet_id=booklet_id, sort_by="page_number", limit=1000)
+        conn = self._conn()
+        cursor = conn.cursor()
+
+        # Direct range scan over idx_cards_booklet_page — the index already
+        # yields (booklet_id, page_number, slot_position) order, so SQLite
+        # skips the sort step. No LIMIT: large booklets return in full.
+        cursor.execute(f"""
+            {_SELECT_CARDS}
+            WHERE booklet_id = ?
+            ORDER BY page_number, slot_position
+        """, (booklet_id,))
+
+        return [Card.from_row(row) for row in cursor.fetchall()]
     
     def get_cards_by_page(self, booklet_id: int, page_number: int) -> List[Card]:
         """Get all cards on a specific page."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._conn()
         cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT * FROM cards 
+        cursor.execute(f"""
+            {_SELECT_CARDS}
             WHERE booklet_id = ? AND page_number = ?
             ORDER BY slot_position
         """, (booklet_id, page_number))
         
-        cards = [Card(**dict(row)) for row in cursor.fetchall()]
-        conn.close()
+        cards = [Card.from_row(row) for row in cursor.fetchall()]
         return cards
     
     # ==================== STATISTICS ====================
     
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _distinct_skip_sql(column: str) -> str:
+        """
+        Skip-scan for the distinct non-empty values of an indexed cards
+        column. Only ever called with hardcoded column names.
+        """
+        return f"""
+            WITH RECURSIVE t(v) AS (
+                SELECT (SELECT MIN({column}) FROM cards WHERE {column} > '')
+                UNION ALL
+                SELECT (SELECT MIN({column}) FROM cards WHERE {column} > t.v)
+                FROM t WHERE t.v IS NOT NULL
+            )
+            SELECT v FROM t WHERE v IS NOT NULL
+        """
+
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get comprehensive statistics about the collection."""
-        conn = sqlite3.connect(self.db_path)
+        # The dashboard polls this endpoint far more often than the
+        # collection changes; serve the memoized dict until a write bumps
+        # _stats_version.
+        cached = self._stats_cache
+        if cached is not None and cached[0] == self._stats_version:
+            return cached[1]
+        version = self._stats_version
+
+        conn = self._conn()
         cursor = conn.cursor()
         
         stats = {}
-        
-        # Total counts
-        cursor.execute("SELECT COUNT(*) FROM cards")
-        stats["total_cards"] = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM booklets")
-        stats["total_booklets"] = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(DISTINCT page_id) FROM cards WHERE page_id IS NOT NULL")
-        stats["total_pages_scanned"] = cursor.fetchone()[0]
-        
-        # Special attributes
-        cursor.execute("SELECT COUNT(*) FROM cards WHERE is_rookie = 1")
-        stats["rookie_cards"] = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM cards WHERE is_auto = 1")
-        stats["auto_cards"] = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM cards WHERE is_patch = 1 OR is_memorabilia = 1")
-        stats["patch_memo_cards"] = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM cards WHERE is_numbered = 1")
-        stats["numbered_cards"] = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM cards WHERE is_ssp = 1")
-        stats["ssp_cards"] = cursor.fetchone()[0]
-        
-        # Value
-        cursor.execute("SELECT SUM(estimated_value) FROM cards")
-        stats["total_estimated_value"] = cursor.fetchone()[0] or 0
-        
-        # Lists
-        cursor.execute("SELECT DISTINCT sport FROM cards WHERE sport IS NOT NULL AND sport != '' ORDER BY sport")
-        stats["sports"] = [row[0] for row in cursor.fetchall()]
-        
-        cursor.execute("SELECT DISTINCT set_name FROM cards WHERE set_name IS NOT NULL AND set_name != '' ORDER BY set_name")
-        stats["sets"] = [row[0] for row in cursor.fetchall()]
-        
-        cursor.execute("SELECT DISTINCT booklet_name FROM cards WHERE booklet_name IS NOT NULL AND booklet_name != '' ORDER BY booklet_name")
-        stats["booklets"] = [row[0] for row in cursor.fetchall()]
-        
-        # Top players
+
+        # All per-card counts, the value total, the confidence average, and
+        # the booklet count in one statement instead of ten separate scans
         cursor.execute("""
-            SELECT player_name, COUNT(*) as count 
-            FROM cards 
-            WHERE player_name IS NOT NULL AND player_name != ''
-            GROUP BY player_name 
-            ORDER BY count DESC 
-            LIMIT 10
+            SELECT COUNT(*),
+                   COUNT(DISTINCT page_id),
+                   COALESCE(SUM(is_rookie = 1), 0),
+                   COALESCE(SUM(is_auto = 1), 0),
+                   COALESCE(SUM(is_patch = 1 OR is_memorabilia = 1), 0),
+                   COALESCE(SUM(is_numbered = 1), 0),
+                   COALESCE(SUM(is_ssp = 1), 0),
+                   COALESCE(SUM(estimated_value), 0),
+                   AVG(CASE WHEN confidence > 0 THEN confidence END),
+                   (SELECT COUNT(*) FROM booklets)
+            FROM cards
         """)
-        stats["top_players"] = [(row[0], row[1]) for row in cursor.fetchall()]
-        
-        # Top teams
+        (stats["total_cards"], stats["total_pages_scanned"],
+         stats["rookie_cards"], stats["auto_cards"], stats["patch_memo_cards"],
+         stats["numbered_cards"], stats["ssp_cards"],
+         stats["total_estimated_value"], avg_confidence,
+         stats["total_booklets"]) = cursor.fetchone()
+
+        # Distinct value lists via index skip-scan: the recursive CTE hops
+        # from one distinct key to the next with an index seek per value,
+        # O(K log N) instead of DISTINCT's full scan + dedup b-tree. The MIN
+        # chain emits values in ascending order, so no sort step either.
+        stats["sports"] = [row[0] for row in cursor.execute(self._distinct_skip_sql("sport"))]
+        stats["sets"] = [row[0] for row in cursor.execute(self._distinct_skip_sql("set_name"))]
+
+        # Same trick on booklet_id (leading column of idx_cards_booklet_page),
+        # then the handful of distinct ids join to their names.
         cursor.execute("""
-            SELECT team, COUNT(*) as count 
-            FROM cards 
-            WHERE team IS NOT NULL AND team != ''
-            GROUP BY team 
-            ORDER BY count DESC 
-            LIMIT 10
+            WITH RECURSIVE t(v) AS (
+                SELECT (SELECT MIN(booklet_id) FROM cards)
+                UNION ALL
+                SELECT (SELECT MIN(booklet_id) FROM cards WHERE booklet_id > t.v)
+                FROM t WHERE t.v IS NOT NULL
+            )
+            SELECT b.name FROM t
+            JOIN booklets b ON b.id = t.v
+            WHERE b.name != ''
+            ORDER BY b.name
         """)
-        stats["top_teams"] = [(row[0], row[1]) for row in cursor.fetchall()]
+        stats["booklets"] = [row[0] for row in cursor.fetchall()]
         
-        # Cards by booklet
+        # Top players, top teams, and per-booklet counts in one statement:
+        # the UNION ALL arms group each dimension, a window ranks them, and
+        # one pass over the ranked rows replaces three separate queries.
+        # Booklet rows keep name order and no cap; the other two are the
+        # usual count-DESC top 10.
         cursor.execute("""
-            SELECT booklet_name, COUNT(*) as count 
-            FROM cards 
-            WHERE booklet_name IS NOT NULL AND booklet_name != ''
-            GROUP BY booklet_name 
-            ORDER BY booklet_name
+            WITH g AS (
+                SELECT 'player' AS k, player_name AS v, COUNT(*) AS c
+                FROM cards
+                WHERE player_name IS NOT NULL AND player_name != ''
+                GROUP BY player_name
+                UNION ALL
+                SELECT 'team', team, COUNT(*)
+                FROM cards
+                WHERE team IS NOT NULL AND team != ''
+                GROUP BY team
+                UNION ALL
+                SELECT 'booklet', b.name, COUNT(*)
+                FROM cards JOIN booklets b ON cards.booklet_id = b.id
+                WHERE b.name != ''
+                GROUP BY b.name
+            ),
+            r AS (
+                SELECT k, v, c,
+                       ROW_NUMBER() OVER (PARTITION BY k ORDER BY c DESC) AS rn
+                FROM g
+            )
+            SELECT k, v, c FROM r
+            WHERE (k IN ('player', 'team') AND rn <= 10) OR k = 'booklet'
+            ORDER BY k, CASE WHEN k = 'booklet' THEN v END, c DESC
         """)
-        stats["cards_by_booklet"] = [(row[0], row[1]) for row in cursor.fetchall()]
-        
-        # Average confidence
-        cursor.execute("SELECT AVG(confidence) FROM cards WHERE confidence > 0")
-        stats["avg_confidence"] = cursor.fetchone()[0] or 0
-        
-        conn.close()
+        grouped = {"player": [], "team": [], "booklet": []}
+        for k, v, c in cursor.fetchall():
+            grouped[k].append((v, c))
+        stats["top_players"] = grouped["player"]
+        stats["top_teams"] = grouped["team"]
+        stats["cards_by_booklet"] = grouped["booklet"]
+        
+        # Average confidence (computed in the aggregate pass above)
+        stats["avg_confidence"] = avg_confidence or 0
+
+        # Key the cache on the version read before computing, so a write
+        # that lands mid-build leaves the entry already stale.
+        self._stats_cache = (version, stats)
         return stats
     
     # ==================== VALUE ENGINE INTEGRATION ====================
     
+    _UPDATE_VALUATION_SQL = """
+        UPDATE cards SET
+            estimated_value = ?,
+            confidence_score = ?,
+            value_range_low = ?,
+            value_range_high = ?,
+            market_trend = ?,
+            grading_rec = ?,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """
+    _INSERT_HISTORY_SQL = """
+        INSERT INTO value_history (card_id, estimated_value, confidence_score)
+        VALUES (?, ?, ?)
+    """
+
     def update_card_valuation(self, card_id: int, estimated_value: float,
                                confidence_score: float = 0.0,
                                value_range_low: float = 0.0,
@@ -879,82 +1278,102 @@ class CardDatabase:
                                market_trend: str = "",
                                grading_rec: str = "") -> bool:
         """Update a card's value fields and record in history."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE cards SET
-                estimated_value = ?,
-                confidence_score = ?,
-                value_range_low = ?,
-                value_range_high = ?,
-                market_trend = ?,
-                grading_rec = ?,
-                updated_at = ?
-            WHERE id = ?
-        """, (
-            estimated_value, confidence_score,
-            value_range_low, value_range_high,
-            market_trend, grading_rec,
-            datetime.now().isoformat(), card_id
-        ))
-        
-        # Record in history
-        cursor.execute("""
-            INSERT INTO value_history (card_id, estimated_value, confidence_score)
-            VALUES (?, ?, ?)
-        """, (card_id, estimated_value, confidence_score))
-        
-        conn.commit()
-        conn.close()
+        with self._write_tx() as conn:
+            conn.execute(self._UPDATE_VALUATION_SQL, (
+                estimated_value, confidence_score,
+                value_range_low, value_range_high,
+                market_trend, grading_rec,
+                card_id
+            ))
+            conn.execute(self._INSERT_HISTORY_SQL,
+                         (card_id, estimated_value, confidence_score))
         return True
+
+    def update_card_valuations_bulk(self, valuations: List[Tuple]) -> int:
+        """
+        Apply many valuations in one transaction.
+
+        Each entry mirrors update_card_valuation's positional arguments:
+        (card_id, estimated_value, confidence_score, value_range_low,
+        value_range_high, market_trend, grading_rec). A full revaluation
+        pass previously paid one commit (and fsync) per card; here the
+        UPDATEs and history INSERTs all land under a single commit.
+        Returns the number of valuations applied.
+        """
+        if not valuations:
+            return 0
+
+        update_rows = [
+            (est, conf, lo, hi, trend, rec, card_id)
+            for card_id, est, conf, lo, hi, trend, rec in valuations
+        ]
+        history_rows = [(card_id, est, conf)
+                        for card_id, est, conf, _lo, _hi, _trend, _rec in valuations]
+        with self._write_tx() as conn:
+            conn.executemany(self._UPDATE_VALUATION_SQL, update_rows)
+            conn.executemany(self._INSERT_HISTORY_SQL, history_rows)
+        return len(valuations)
     
-    def get_value_history(self, card_id: int) -> List[Dict[str, Any]]:
-        """Get value history for a card."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
+    def iter_value_history(self, card_id: int) -> Iterator[sqlite3.Row]:
+        """
+        Stream value history rows for a card, newest first.
+
+        Yields sqlite3.Row objects — addressable by column name like dicts,
+        but without the per-row dict copy the old list builder made. Rows
+        arrive in fetchmany batches, so a long history never sits fully
+        materialized unless the caller lists it.
+        """
+        cursor = self._conn().cursor()
+        cursor.arraysize = 200
         cursor.execute("""
-            SELECT * FROM value_history 
-            WHERE card_id = ? 
+            SELECT * FROM value_history
+            WHERE card_id = ?
             ORDER BY recorded_at DESC
         """, (card_id,))
-        
-        history = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return history
+
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                return
+            yield from rows
+
+    def get_value_history(self, card_id: int) -> List[sqlite3.Row]:
+        """Get value history for a card (materialized iter_value_history)."""
+        return list(self.iter_value_history(card_id))
     
     # ==================== EXPORT ====================
     
     def export_to_csv(self, output_path: str, **filters):
         """Export the collection to CSV with optional filters."""
         import csv
-        
-        cards = self.search_cards(**filters, limit=100000)
-        
+
+        sort_by = filters.pop("sort_by", "player_name")
+        sort_order = filters.pop("sort_order", "ASC")
+        if sort_by not in self._SORT_COLUMNS:
+            sort_by = "player_name"
+        sort_order = "DESC" if sort_order.upper() == "DESC" else "ASC"
+
+        conditions, params = self._filter_conditions(**filters)
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+
+        # _EXPORT_SELECT projects exactly the exported columns (location is
+        # composed in SQL), so rows stream from the cursor straight into
+        # csv.writer — no Card objects, no per-row dicts, no dropped extras.
+        cursor = self._conn().execute(
+            f"{_EXPORT_SELECT} WHERE {where_clause} "
+            f"ORDER BY {self._SORT_SQL[sort_by]} {sort_order}",
+            params,
+        )
+
+        count = 0
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            if not cards:
-                return 0
-            
-            # Define columns for export
-            columns = [
-                'id', 'player_name', 'team', 'year', 'sport', 'position',
-                'brand', 'set_name', 'subset', 'card_number', 'parallel',
-                'is_rookie', 'is_auto', 'is_patch', 'is_memorabilia',
-                'is_numbered', 'numbering', 'is_ssp', 'ssp_type',
-                'confidence', 'booklet_name', 'page_number', 'slot_position',
-                'location', 'condition', 'estimated_value', 'notes'
-            ]
-            
-            writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
-            writer.writeheader()
-            
-            for card in cards:
-                row = card.to_dict()
+            writer = csv.writer(f)
+            writer.writerow(_EXPORT_COLUMNS)
+            for row in cursor:
                 writer.writerow(row)
-        
-        return len(cards)
+                count += 1
+
+        return count
 
 
 if __name__ == "__main__":
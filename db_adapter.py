@@ -4,29 +4,46 @@ Unified interface for SQLite (dev/local) and MySQL (production/Railway).
 Handles ? → %s conversion and schema differences transparently.
 """
 
+import functools
 import os
 import re
 import sqlite3
 
+# Compiled once at import — every _MySQLCursor.execute goes through the
+# translator, and re.sub with inline flags recompiles per call.
+_RE_AUTOINC = re.compile(r'\bAUTOINCREMENT\b', re.IGNORECASE)
+_RE_INT_PK = re.compile(r'\bINTEGER PRIMARY KEY AUTO_INCREMENT\b', re.IGNORECASE)
+_RE_BOOL = re.compile(r'\bBOOLEAN\b', re.IGNORECASE)
 
+
+@functools.lru_cache(maxsize=512)
 def _fix_sql_for_mysql(sql):
-    """Convert SQLite SQL to MySQL-compatible SQL."""
+    """Convert SQLite SQL to MySQL-compatible SQL.
+
+    Cached on the SQL text: the app issues a small set of distinct query
+    strings, so after warmup translation is a dict lookup.
+    """
     # Parameterized query placeholders
     sql = sql.replace("?", "%s")
     # AUTOINCREMENT (SQLite) → AUTO_INCREMENT (MySQL)
-    sql = re.sub(r'\bAUTOINCREMENT\b', 'AUTO_INCREMENT', sql, flags=re.IGNORECASE)
+    sql = _RE_AUTOINC.sub('AUTO_INCREMENT', sql)
     # INTEGER PRIMARY KEY → INT PRIMARY KEY (MySQL doesn't like INTEGER for PK with AUTO_INCREMENT)
-    sql = re.sub(r'\bINTEGER PRIMARY KEY AUTO_INCREMENT\b',
-                 'INT AUTO_INCREMENT PRIMARY KEY', sql, flags=re.IGNORECASE)
+    sql = _RE_INT_PK.sub('INT AUTO_INCREMENT PRIMARY KEY', sql)
     # BOOLEAN → TINYINT(1)
-    sql = re.sub(r'\bBOOLEAN\b', 'TINYINT(1)', sql, flags=re.IGNORECASE)
+    sql = _RE_BOOL.sub('TINYINT(1)', sql)
     # TEXT NOT NULL DEFAULT '' → VARCHAR(255) NOT NULL DEFAULT '' for indexed cols
     # (MySQL needs explicit lengths for indexed TEXT — we keep TEXT for non-indexed)
     return sql
 
 
 class _MySQLCursor:
-    """Wraps a PyMySQL cursor to auto-convert SQLite syntax."""
+    """Wraps a PyMySQL cursor to auto-convert SQLite syntax.
+
+    Wraps a plain tuple cursor rather than DictCursor: pymysql's DictCursor
+    hashes every column name per row, which is expensive on the 30+-column
+    cards table. We zip against the column names once per fetch instead,
+    so rows stay dict-accessible like sqlite3.Row.
+    """
     def __init__(self, cursor):
         self._cur = cursor
 
@@ -40,14 +57,24 @@ class _MySQLCursor:
         sql = _fix_sql_for_mysql(sql)
         return self._cur.executemany(sql, params or [])
 
+    def _columns(self):
+        desc = self._cur.description
+        return [d[0] for d in desc] if desc else []
+
     def fetchone(self):
-        return self._cur.fetchone()
+        row = self._cur.fetchone()
+        if row is None:
+            return None
+        return dict(zip(self._columns(), row))
 
     def fetchall(self):
-        return self._cur.fetchall()
+        cols = self._columns()
+        return [dict(zip(cols, row)) for row in self._cur.fetchall()]
 
     def fetchmany(self, size=None):
-        return self._cur.fetchmany(size)
+        cols = self._columns()
+        raw = self._cur.fetchmany(size) if size else self._cur.fetchmany()
+        return [dict(zip(cols, row)) for row in raw]
 
     @property
     def lastrowid(self):
@@ -73,9 +100,9 @@ class _MySQLConnection:
         self._conn = conn
 
     def cursor(self):
-        # Use DictCursor so rows are accessible by column name (like sqlite3.Row)
-        import pymysql.cursors
-        return _MySQLCursor(self._conn.cursor(pymysql.cursors.DictCursor))
+        # Plain tuple cursor — _MySQLCursor converts rows to dicts per fetch
+        # (one zip per batch) instead of DictCursor's per-row key hashing.
+        return _MySQLCursor(self._conn.cursor())
 
     def execute(self, sql, params=None):
         cur = self.cursor()
@@ -7,8 +7,13 @@ Author: HutchGroup LLC
 """
 
 import base64
+import pickle
+import sqlite3
+import threading
 import time
 import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
@@ -19,9 +24,22 @@ try:
 except ImportError:
     requests = None  # Graceful fallback for environments without requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional C-speed JSON parser — stdlib json otherwise
+
 from card_value_engine import MarketDataPoint, CardAttributes, CardCondition
 
 
+def _parse_json(response) -> Any:
+    """Decode a JSON response body. A 50-item eBay result runs 50-200 KB,
+    so the C parser is worth the optional dependency."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -66,8 +84,9 @@ class TokenManager:
     Uses client credentials flow (no user login needed for sold data).
     """
     
-    def __init__(self, config: EbayConfig):
+    def __init__(self, config: EbayConfig, session=None):
         self.config = config
+        self.session = session  # Optional shared requests.Session
         self._token: Optional[str] = None
         self._expires_at: float = 0.0
     
@@ -97,7 +116,8 @@ class TokenManager:
             "scope": self.config.scope,
         }
         
-        response = requests.post(
+        http = self.session or requests
+        response = http.post(
             self.config.auth_url,
             headers=headers,
             data=body,
@@ -128,26 +148,29 @@ class RateLimiter:
     def __init__(self, max_calls: int = 5000, window_seconds: int = 86400):
         self.max_calls = max_calls
         self.window = window_seconds
-        self._timestamps: List[float] = []
-    
+        # Timestamps are appended in order, so expired ones are always at the
+        # left — popleft until fresh instead of rebuilding the whole list.
+        self._timestamps: deque = deque()
+
+    def _evict_expired(self) -> None:
+        cutoff = time.time() - self.window
+        while self._timestamps and self._timestamps[0] <= cutoff:
+            self._timestamps.popleft()
+
     def acquire(self) -> bool:
         """Try to acquire a rate limit slot. Returns True if allowed."""
-        now = time.time()
-        cutoff = now - self.window
-        self._timestamps = [t for t in self._timestamps if t > cutoff]
-        
+        self._evict_expired()
+
         if len(self._timestamps) >= self.max_calls:
             return False
-        
-        self._timestamps.append(now)
+
+        self._timestamps.append(time.time())
         return True
-    
+
     @property
     def remaining(self) -> int:
-        now = time.time()
-        cutoff = now - self.window
-        active = sum(1 for t in self._timestamps if t > cutoff)
-        return max(0, self.max_calls - active)
+        self._evict_expired()
+        return max(0, self.max_calls - len(self._timestamps))
 
 
 # ============================================================================
@@ -162,13 +185,60 @@ class EbayMarketFetcher:
     Finding API (findCompletedItems) depending on availability.
     """
     
-    def __init__(self, config: EbayConfig):
+    CACHE_PATH = "ebay_cache.db"
+
+    def __init__(self, config: EbayConfig, cache_path: str = CACHE_PATH):
         self.config = config
-        self.tokens = TokenManager(config)
+        # Shared session: connection pooling + HTTP keep-alive, so concurrent
+        # batch fetches reuse TCP/TLS handshakes instead of reconnecting.
+        self.session = None
+        if requests is not None:
+            self.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=16, pool_maxsize=16,
+            )
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        self.tokens = TokenManager(config, session=self.session)
         self.limiter = RateLimiter(max_calls=4500)  # Leave buffer
-        self._cache: Dict[str, tuple] = {}  # key -> (timestamp, data)
+        # Single-flight bookkeeping: one Event per cache key currently being
+        # fetched, so concurrent identical queries spend one API call.
+        self._inflight: Dict[str, threading.Event] = {}
+        self._inflight_lock = threading.Lock()
         self.cache_ttl = 3600  # 1 hour cache
-    
+        # Persistent response cache — survives restarts and is shared across
+        # workers, so a redeploy doesn't burn the eBay rate-limit budget
+        # re-fetching comps we already have.
+        self._cache_lock = threading.Lock()
+        self._cache = sqlite3.connect(
+            cache_path, isolation_level=None, check_same_thread=False,
+        )
+        self._cache.execute("PRAGMA journal_mode=WAL")
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS ebay_cache("
+            "key TEXT PRIMARY KEY, ts REAL, payload BLOB)"
+        )
+
+    def _cache_get(self, key: str) -> Optional[List[MarketDataPoint]]:
+        """Return cached data points for key, or None if missing/stale."""
+        with self._cache_lock:
+            row = self._cache.execute(
+                "SELECT ts, payload FROM ebay_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row and time.time() - row[0] < self.cache_ttl:
+            try:
+                return pickle.loads(row[1])
+            except Exception:
+                return None  # Corrupt/stale pickle — treat as a miss
+        return None
+
+    def _cache_put(self, key: str, data: List[MarketDataPoint]) -> None:
+        with self._cache_lock:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO ebay_cache(key, ts, payload) VALUES (?, ?, ?)",
+                (key, time.time(), pickle.dumps(data)),
+            )
+
     def fetch_sold_listings(self, card: CardAttributes, 
                             limit: int = 10) -> List[MarketDataPoint]:
         """
@@ -180,33 +250,55 @@ class EbayMarketFetcher:
         
         # Check cache
         cache_key = self._cache_key(card)
-        if cache_key in self._cache:
-            cached_time, cached_data = self._cache[cache_key]
-            if time.time() - cached_time < self.cache_ttl:
-                return cached_data
-        
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Single-flight: under burst revaluation several threads can miss the
+        # cache for the same card at once. The first becomes the leader and
+        # fetches; the rest wait on its Event and re-read the cache.
+        with self._inflight_lock:
+            event = self._inflight.get(cache_key)
+            leader = event is None
+            if leader:
+                event = self._inflight[cache_key] = threading.Event()
+
+        if not leader:
+            event.wait(timeout=30)
+            return self._cache_get(cache_key) or []
+
+        try:
+            return self._fetch_and_cache(card, cache_key, limit)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+            event.set()
+
+    def _fetch_and_cache(self, card: CardAttributes, cache_key: str,
+                         limit: int) -> List[MarketDataPoint]:
+        """Leader path of fetch_sold_listings: hit the API, cache the result."""
         # Check rate limit
         if not self.limiter.acquire():
             print("eBay rate limit reached — falling back to cached/mock data")
             return []
-        
+
         try:
             # Build search query
             query = self._build_query(card)
-            
+
             # SOLD COMPS ONLY — Finding API (findCompletedItems + SoldItemsOnly=true)
             # Browse API is intentionally excluded: it returns active listings
             # (asking prices), not actual sold transactions. Always use Finding API.
             results = self._search_finding_api(query, limit)
-            
+
             # Parse into MarketDataPoints
             data_points = self._parse_results(results, card)
-            
+
             # Cache results
-            self._cache[cache_key] = (time.time(), data_points)
-            
+            self._cache_put(cache_key, data_points)
+
             return data_points
-            
+
         except Exception as e:
             print(f"eBay API error: {e}")
             return []
@@ -215,43 +307,45 @@ class EbayMarketFetcher:
         """
         Build a tight eBay sold comp search query.
         Goal: match the exact card variant, not a broad pool that inflates value.
+        Consumes the card's precomputed fingerprint (one field walk per card,
+        shared with the cache key).
         """
-        parts = [card.player]
+        (player, year, set_name, card_number, parallel,
+         serial_run, rookie, autograph, grade) = card.fingerprint
+
+        parts = [player]
 
         # Year + set — most sellers write "2020 Prizm" or "2017 Panini Prizm"
-        if card.year:
-            parts.append(str(card.year))
-        if card.set_name:
-            parts.append(card.set_name)
+        if year:
+            parts.append(str(year))
+        if set_name:
+            parts.append(set_name)
 
         # Card number — sellers use both "#269" and "269" formats; use bare number
-        if card.card_number:
-            num = str(card.card_number).lstrip("#")
-            parts.append(f"#{num}")
+        if card_number:
+            parts.append(f"#{str(card_number).lstrip('#')}")
 
         # Grade first (most important filter — PSA 10 vs raw is 5-10x difference)
-        if card.graded and card.grade_value is not None:
-            grading_co = getattr(card, "grading_company", "PSA") or "PSA"
-            grade_str = str(card.grade_value)
+        if grade:
+            grading_co, grade_value = grade
+            grade_str = str(grade_value)
             # Format: 10.0 → "10", 9.5 → "9.5"
             if grade_str.endswith(".0"):
                 grade_str = grade_str[:-2]
             parts.append(f"{grading_co} {grade_str}")
 
         # Parallel — be exact (Silver, Gold, Hyper, etc.)
-        if card.parallel:
-            parts.append(card.parallel)
+        if parallel:
+            parts.append(parallel)
 
         # Print run (serial numbered) — critical for value
-        if card.serial_number:
-            match = re.search(r'/(\d+)', card.serial_number)
-            if match:
-                parts.append(f"/{match.group(1)}")
+        if serial_run:
+            parts.append(f"/{serial_run}")
 
         # RC / Auto — short forms eBay sellers actually use
-        if card.rookie:
+        if rookie:
             parts.append("RC")
-        if card.autograph:
+        if autograph:
             parts.append("auto")
 
         return " ".join(parts)
@@ -276,10 +370,10 @@ class EbayMarketFetcher:
             }
             
             url = f"{self.config.browse_url}/item_summary/search"
-            response = requests.get(url, headers=headers, params=params, timeout=15)
+            response = self.session.get(url, headers=headers, params=params, timeout=15)
             
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 return data.get("itemSummaries", [])
             
             return []
@@ -314,15 +408,15 @@ class EbayMarketFetcher:
                 "paginationInput.entriesPerPage": min(limit, 50),
             }
             
-            response = requests.get(
-                self.config.finding_url, 
+            response = self.session.get(
+                self.config.finding_url,
                 headers=headers, 
                 params=params, 
                 timeout=15,
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = _parse_json(response)
                 search_result = (
                     data.get("findCompletedItemsResponse", [{}])[0]
                     .get("searchResult", [{}])[0]
@@ -428,7 +522,10 @@ class EbayMarketFetcher:
         return None
     
     def _cache_key(self, card: CardAttributes) -> str:
-        return f"{card.player}|{card.year}|{card.set_name}|{card.parallel or ''}|{card.serial_number or ''}"
+        # Derived from the same fingerprint as the search query, so any two
+        # cards that would produce different queries get different entries
+        # (the old key ignored grade — a PSA 10 and a raw copy collided).
+        return repr(card.fingerprint)
 
 
 # ============================================================================
@@ -466,9 +563,25 @@ class MarketDataFetcher:
         if not points:
             from card_value_engine import MockDataFactory
             points = MockDataFactory.generate(card)
-        
+
         return points
 
+    def fetch_all_batch(self, cards: List[CardAttributes],
+                        max_workers: int = 8) -> Dict[int, List[MarketDataPoint]]:
+        """
+        Fetch market data for a batch of cards concurrently.
+        Returns {index in `cards`: data points}. eBay calls are network-bound,
+        so overlapping them over the shared keep-alive session gives near-linear
+        speedup; each worker still goes through the rate limiter.
+        """
+        if not cards:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(cards))) as pool:
+            results = pool.map(self.fetch_all, cards)
+
+        return dict(enumerate(results))
+
 
 # ============================================================================
 # CONVENIENCE: Create fetcher from environment or direct keys
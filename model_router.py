@@ -9,10 +9,58 @@ Tiers:
 """
 
 import anthropic
+import asyncio
 import base64
+import httpx
+import hashlib
+import io
 import json
+import logging
+import mmap
+import os
+import random
+import re
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None  # Pillow optional — without it images upload verbatim
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None  # Optional SIMD base64 — stdlib encoder otherwise
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional C-speed JSON parser — stdlib json otherwise
+
+try:
+    import numpy as _np
+except ImportError:
+    _np = None  # NumPy only accelerates cost aggregation
+
+
+def _loads(text: str):
+    """Parse a JSON document with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _b64encode(data: bytes) -> str:
+    """Base64-encode image bytes to str. pybase64's SIMD encoder runs several
+    times faster per byte and skips the decode()/UTF-8 validation step."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.standard_b64encode(data).decode("utf-8")
+
 # Model constants
 MODEL_FAST  = "claude-haiku-3-5-20241022"
 MODEL_SMART = "claude-sonnet-4-20250514"
@@ -21,128 +69,862 @@ MODEL_BEST  = "claude-opus-4-5"
 # Confidence threshold below which we escalate to a better model
 ESCALATE_THRESHOLD = 0.55
 
+# Prescreen confidence above which the first identify pass can stay on Haiku
+FAST_ROUTE_THRESHOLD = 0.9
+
+_router_log = logging.getLogger("cardvault.router")
+
+# Process-wide client: a fresh Anthropic() per request pays a TLS handshake
+# (~50-150 ms) every call. One pooled transport keeps connections alive and
+# sized for prescreen/identify overlap.
+_SHARED_CLIENT: "anthropic.Anthropic | None" = None
+
+
+def get_client() -> anthropic.Anthropic:
+    """Shared Anthropic client over a keep-alive connection pool."""
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        try:
+            http_client = httpx.Client(http2=True, limits=limits, timeout=30.0)
+        except ImportError:
+            # http2 extra (h2) not installed — HTTP/1.1 keep-alive still
+            # saves the handshake, just without multiplexing
+            http_client = httpx.Client(limits=limits, timeout=30.0)
+        _SHARED_CLIENT = anthropic.Anthropic(http_client=http_client)
+    return _SHARED_CLIENT
+
+
+# Transient failures worth retrying: rate limits, dropped connections, 5xx.
+# Anything else propagates immediately to each call site's own fallback —
+# swallowing a 429 behind placeholder copy just degrades quality silently.
+_RETRYABLE = (anthropic.RateLimitError, anthropic.APIConnectionError,
+              anthropic.InternalServerError)
+_MAX_ATTEMPTS = 4
+
+
+def _backoff(attempt: int) -> float:
+    # Doubles per attempt with jitter so synchronized callers fan out; capped
+    # at 8 s to bound worst-case stall
+    return min(2 ** attempt * 0.5 + random.random() * 0.2, 8.0)
+
+
+def _with_retries(call):
+    """Run an API call, retrying transient errors with exponential backoff."""
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return call()
+        except _RETRYABLE:
+            if attempt == _MAX_ATTEMPTS - 1:
+                raise
+            time.sleep(_backoff(attempt))
+
+
+async def _with_retries_async(call):
+    """Async _with_retries — backs off on the event loop, not the thread."""
+    for attempt in range(_MAX_ATTEMPTS):
+        try:
+            return await call()
+        except _RETRYABLE:
+            if attempt == _MAX_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(_backoff(attempt))
+
+
+# Claude vision resolves at most ~1568 px on the long side; anything bigger
+# gets downsampled server-side after we paid to upload and tokenize it.
+_RESIZE_MAX_DIM = 1568
+_RESIZE_JPEG_QUALITY = 85
+_RESIZE_THRESHOLD = 400_000  # bytes — tiny images skip the resize entirely
+_RESIZE_CACHE_DIR = Path.home() / ".cardvault" / "resized"
+
+
+def _downscaled_jpeg(raw) -> "bytes | None":
+    """
+    Downscale a large image to an 85-quality JPEG bounded at 1568 px.
+    Returns None when the original should upload as-is (small file, Pillow
+    missing, or unreadable image). Resized bytes are cached on disk keyed by
+    content hash, so prescreen and identify share one resize per image.
+    """
+    if Image is None or len(raw) <= _RESIZE_THRESHOLD:
+        return None
+
+    key = hashlib.sha1(raw).hexdigest()
+    cache_file = _RESIZE_CACHE_DIR / f"{key}-{_RESIZE_MAX_DIM}-{_RESIZE_JPEG_QUALITY}.jpg"
+    if cache_file.exists():
+        return cache_file.read_bytes()
+
+    try:
+        img = Image.open(io.BytesIO(raw))
+        img.thumbnail((_RESIZE_MAX_DIM, _RESIZE_MAX_DIM), Image.LANCZOS)
+        buf = io.BytesIO()
+        img.convert("RGB").save(buf, "JPEG", quality=_RESIZE_JPEG_QUALITY, optimize=True)
+    except Exception:
+        return None  # Not an image Pillow can read — upload verbatim
+    data = buf.getvalue()
+
+    try:
+        _RESIZE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(data)
+    except OSError:
+        pass  # Cache is best-effort; the resize itself still happened
+    return data
+
+
+@contextmanager
+def _image_buffer(path: Path):
+    """
+    Read-only buffer over an image file, mmap-backed where possible so the
+    OS page cache holds the only full copy — the content hash and the base64
+    encoder both consume the buffer directly instead of a read() allocation.
+    Falls back to plain bytes for empty files (mmap refuses length 0).
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            yield f.read()
+            return
+        with mm:
+            yield mm
+
+
+def _sniff(head: bytes) -> str:
+    """Media type from the first 12 bytes. Magic numbers instead of the file
+    extension — a PNG saved as .jpg used to upload with the wrong media_type,
+    get rejected by the API, and burn a retry."""
+    if head[:3] == b"\xff\xd8\xff":
+        return "image/jpeg"
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/jpeg"
+
+
+def _encode_bytes(raw) -> tuple[str, str]:
+    """Returns (base64_data, media_type) for in-memory image bytes (or any
+    bytes-like buffer). Large images are downscaled first — a phone JPEG
+    shrinks 5-10x, cutting upload time and input-token billing."""
+    small = _downscaled_jpeg(raw)
+    if small is not None:
+        return _b64encode(small), "image/jpeg"
+    return _b64encode(raw), _sniff(bytes(raw[:12]))
+
 
 def _encode_image(image_path: str) -> tuple[str, str]:
     """Returns (base64_data, media_type)."""
-    path = Path(image_path)
-    ext = path.suffix.lower()
-    media_map = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png", ".webp": "image/webp"}
-    media_type = media_map.get(ext, "image/jpeg")
-    with open(image_path, "rb") as f:
-        return base64.standard_b64encode(f.read()).decode("utf-8"), media_type
+    with _image_buffer(Path(image_path)) as buf:
+        return _encode_bytes(buf)
+
+
+_PRESCREEN_PROMPT = """Look at this image. Answer ONLY with valid JSON, no other text:
+{
+  "is_card": true/false,
+  "usable": true/false,
+  "reason": "one short sentence",
+  "confidence": 0.0-1.0
+}
+
+is_card = true if this is a sports trading card (or a page of them)
+usable = true if the image is clear enough to attempt identification
+confidence = how confident you are in this assessment"""
+
+
+# Prescreen verdicts are pure functions of the image bytes, so repeat
+# uploads (and app restarts) can skip the Haiku round-trip entirely.
+# In-process dict in front of ~/.cardvault/prescreen_cache/{hash}.json;
+# only successful verdicts are cached, never the error fallback.
+_PRESCREEN_CACHE_DIR = Path.home() / ".cardvault" / "prescreen_cache"
+_prescreen_memo: dict = {}
+
+
+def _prescreen_digest(raw: bytes) -> str:
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _prescreen_cache_get(digest: str) -> "dict | None":
+    verdict = _prescreen_memo.get(digest)
+    if verdict is None:
+        try:
+            with open(_PRESCREEN_CACHE_DIR / f"{digest}.json") as f:
+                verdict = json.load(f)
+        except (OSError, ValueError):
+            return None
+        _prescreen_memo[digest] = verdict
+    result = dict(verdict)
+    result["_input_tok"] = result["_output_tok"] = 0  # nothing was spent
+    return result
+
+
+def _prescreen_cache_put(digest: str, result: dict) -> None:
+    verdict = {k: v for k, v in result.items() if not k.startswith("_")}
+    _prescreen_memo[digest] = verdict
+    try:
+        _PRESCREEN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_PRESCREEN_CACHE_DIR / f"{digest}.json", "w") as f:
+            json.dump(verdict, f)
+    except OSError:
+        pass  # Disk cache is best-effort; the memo still has it
+
 
+def _prescreen_params(b64: str, media_type: str) -> dict:
+    """Build the messages.create kwargs for a prescreen call.
 
-def prescreen_image(client: anthropic.Anthropic, image_path: str) -> dict:
+    The static prompt leads the content and carries cache_control, so every
+    prescreen after the first reads it at the cached-input rate (~10% of
+    normal). max_tokens is 80 — the verdict JSON runs ~60 tokens, and the
+    decode budget affects provider-side scheduling under load.
+    """
+    return {
+        "model": MODEL_FAST,
+        "max_tokens": 80,
+        "messages": [{
+            "role": "user",
+            "content": [
+                {"type": "text", "text": _PRESCREEN_PROMPT,
+                 "cache_control": {"type": "ephemeral"}},
+                {"type": "image", "source": {"type": "base64", "media_type": media_type, "data": b64}}
+            ]
+        }]
+    }
+
+
+# Strips a leading/trailing markdown fence in one substitution instead of
+# the old split("```") chain and its intermediate substrings.
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.S)
+
+
+def _prescreen_result(resp) -> dict:
+    text = _FENCE_RE.sub("", resp.content[0].text.strip())
+    result = _loads(text)
+    result["_input_tok"]  = resp.usage.input_tokens
+    result["_output_tok"] = resp.usage.output_tokens
+    return result
+
+
+def _prescreen_fallback(e: Exception) -> dict:
+    # If prescreen fails, assume it's a card and let the main identifier try
+    return {"is_card": True, "usable": True, "reason": f"prescreen error: {e}", "confidence": 0.5,
+            "_input_tok": 0, "_output_tok": 0}
+
+
+def prescreen_image(client: "anthropic.Anthropic | None", image_path: str) -> dict:
     """
     TIER 1 — Haiku prescreen.
     Fast, cheap check: is this a sports card? Is it usable?
     Returns: { is_card: bool, usable: bool, reason: str, confidence: float }
+    Repeat images are served from the content-hash cache without an API call.
+    """
+    client = client or get_client()
+    path = Path(image_path)
+    with _image_buffer(path) as buf:
+        digest = _prescreen_digest(buf)
+        cached = _prescreen_cache_get(digest)
+        if cached is not None:
+            return cached
+        params = _prescreen_params(*_encode_bytes(buf))
+
+    try:
+        resp = _with_retries(lambda: client.messages.create(**params))
+    except Exception as e:
+        return _prescreen_fallback(e)
+    try:
+        result = _prescreen_result(resp)
+    except (ValueError, KeyError, IndexError, AttributeError) as e:
+        return _prescreen_fallback(e)  # malformed JSON — retrying won't help
+
+    _prescreen_cache_put(digest, result)
+    return result
+
+
+# ── Async variants (bulk ingest) ────────────────────────────────────────────
+# Prescreen + identify are network-bound; overlapping requests scales
+# near-linearly up to provider rate limits, so bulk callers gather these
+# instead of looping the sync versions. The semaphore caps in-flight
+# requests process-wide.
+
+_SEM_LIMIT = int(os.getenv("CV_ANTHROPIC_CONCURRENCY", "10"))
+
+# An asyncio.Semaphore binds to whichever loop first awaits it, and the sync
+# app drives these coroutines with one asyncio.run() per bulk upload — a
+# fresh loop each time, so a module-level semaphore survives exactly one
+# contended batch and then raises "bound to a different event loop". One
+# semaphore per running loop instead; stale entries are pruned as loops close.
+_sems: "dict[asyncio.AbstractEventLoop, asyncio.Semaphore]" = {}
+
+
+def _sem() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    sem = _sems.get(loop)
+    if sem is None:
+        for stale in [l for l in _sems if l.is_closed()]:
+            del _sems[stale]
+        sem = _sems[loop] = asyncio.Semaphore(_SEM_LIMIT)
+    return sem
+
+# Resize + base64 are CPU-bound, so once the network side is overlapped via
+# asyncio they become the bulk-ingest bottleneck. Encoding runs in worker
+# processes instead; the pool is created lazily so importing the module never
+# forks (and stays safe under the spawn start method).
+_POOL: "ProcessPoolExecutor | None" = None
+
+
+def _encode_pool() -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+
+async def _encode_image_async(image_path: str) -> tuple[str, str]:
+    """_encode_image offloaded to the process pool — workers re-open the file
+    themselves (mmap hits the page cache) and share the resize disk cache."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_encode_pool(), _encode_image, image_path)
+
+
+async def prescreen_image_async(client: "anthropic.AsyncAnthropic", image_path: str) -> dict:
+    """Async prescreen_image — same verdict dict, cache, and error fallback."""
+    path = Path(image_path)
+    with _image_buffer(path) as buf:
+        digest = _prescreen_digest(buf)
+        cached = _prescreen_cache_get(digest)
+        if cached is not None:
+            return cached
+    params = _prescreen_params(*await _encode_image_async(image_path))
+
+    async def _call():
+        async with _sem():
+            return await client.messages.create(**params)
+
+    try:
+        resp = await _with_retries_async(_call)
+    except Exception as e:
+        return _prescreen_fallback(e)
+    try:
+        result = _prescreen_result(resp)
+    except (ValueError, KeyError, IndexError, AttributeError) as e:
+        return _prescreen_fallback(e)  # malformed JSON — retrying won't help
+
+    _prescreen_cache_put(digest, result)
+    return result
+
+
+async def prescreen_many(client: "anthropic.AsyncAnthropic", image_paths: list) -> list:
+    """Prescreen a batch of images concurrently (bounded by the semaphore)."""
+    return list(await asyncio.gather(
+        *(prescreen_image_async(client, p) for p in image_paths)
+    ))
+
+
+class PrescreenBatcher:
     """
-    b64, media_type = _encode_image(image_path)
-    prompt = """Look at this image. Answer ONLY with valid JSON, no other text:
+    Coalesces bursty prescreen calls into single Message Batches requests.
+
+    A pack upload fires 20 near-simultaneous prescreens; instead of 20 HTTP
+    exchanges, the first submit arms a max_wait_ms timer and the buffer
+    flushes when it holds max_batch items or the timer fires, whichever
+    comes first — burst throughput at batch pricing, and a lone upload only
+    ever waits the window. Cache hits resolve immediately without entering
+    the buffer; a failed or unparseable entry resolves to the same
+    assume-it's-a-card fallback as prescreen_image.
+
+        batcher = PrescreenBatcher(async_client)
+        verdicts = await asyncio.gather(*(batcher.submit(p) for p in paths))
+    """
+
+    POLL_INTERVAL = 5.0  # seconds between processing_status checks
+
+    def __init__(self, client: "anthropic.AsyncAnthropic",
+                 max_batch: int = 16, max_wait_ms: int = 200):
+        self.client = client
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: "asyncio.Task | None" = None
+        self._seq = 0
+
+    async def submit(self, image_path: str) -> dict:
+        """Prescreen one image via the next batch. Same verdict dict as
+        prescreen_image; awaits until the batch containing it completes."""
+        path = Path(image_path)
+        with _image_buffer(path) as buf:
+            digest = _prescreen_digest(buf)
+            cached = _prescreen_cache_get(digest)
+            if cached is not None:
+                return cached
+        params = _prescreen_params(*await _encode_image_async(image_path))
+
+        future = asyncio.get_running_loop().create_future()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.ensure_future(self._run())
+        # Unbounded queue: put_nowait keeps check-then-put atomic on the loop,
+        # so the worker can't slip to idle-exit in between.
+        self._queue.put_nowait((digest, params, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            try:
+                buf = [await asyncio.wait_for(self._queue.get(), timeout=self.max_wait)]
+            except asyncio.TimeoutError:
+                return  # idle — the next submit restarts the worker
+            deadline = time.monotonic() + self.max_wait
+            while len(buf) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    buf.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(buf)
+
+    async def _flush(self, buf: list):
+        pending = {}   # custom_id -> (digest, future)
+        requests = []
+        for digest, params, future in buf:
+            custom_id = f"pre-{self._seq}"
+            self._seq += 1
+            pending[custom_id] = (digest, future)
+            requests.append({"custom_id": custom_id, "params": params})
+
+        try:
+            batch = await self.client.messages.batches.create(requests=requests)
+            while batch.processing_status != "ended":
+                await asyncio.sleep(self.POLL_INTERVAL)
+                batch = await self.client.messages.batches.retrieve(batch.id)
+            results = await self.client.messages.batches.results(batch.id)
+        except Exception as e:
+            for digest, future in pending.values():
+                future.set_result(_prescreen_fallback(e))
+            return
+
+        async for entry in results:
+            digest, future = pending.pop(entry.custom_id)
+            if entry.result.type == "succeeded":
+                try:
+                    result = _prescreen_result(entry.result.message)
+                except Exception as e:
+                    future.set_result(_prescreen_fallback(e))
+                    continue
+                _prescreen_cache_put(digest, result)
+                future.set_result(result)
+            else:
+                future.set_result(_prescreen_fallback(
+                    Exception(f"batch entry {entry.result.type}")))
+
+        # Entries the batch never reported back (shouldn't happen, but a
+        # hung future would wedge the caller forever)
+        for digest, future in pending.values():
+            future.set_result(_prescreen_fallback(Exception("missing batch result")))
+
+
+async def summarize_card_value_async(client: "anthropic.AsyncAnthropic",
+                                     card_data: dict, value: float) -> str:
+    """Async summarize_card_value — same copy, same static fallback."""
+    async def _call():
+        async with _sem():
+            return await client.messages.create(
+                model=MODEL_FAST,
+                max_tokens=70,
+                messages=[{"role": "user", "content": _summary_prompt(card_data, value)}]
+            )
+
+    try:
+        resp = await _with_retries_async(_call)
+        return resp.content[0].text.strip()
+    except Exception:
+        return f"Estimated value: ${value:.2f}"
+
+
+_FUSED_PROMPT = """Look at this image. Answer ONLY with valid JSON, no other text:
 {
   "is_card": true/false,
   "usable": true/false,
   "reason": "one short sentence",
-  "confidence": 0.0-1.0
+  "confidence": 0.0-1.0,
+  "tentative_id": {
+    "player_name": "Full Player Name or Unknown",
+    "team": "Team Name or Unknown",
+    "year": "2023 or Unknown",
+    "sport": "Football|Basketball|Baseball|Hockey|Soccer|Unknown",
+    "brand": "Panini|Topps|etc or Unknown",
+    "set_name": "Prizm|Mosaic|Select|etc or Unknown",
+    "card_number": "#123 or Unknown",
+    "parallel": "Parallel name, Base if standard"
+  }
 }
 
 is_card = true if this is a sports trading card (or a page of them)
 usable = true if the image is clear enough to attempt identification
-confidence = how confident you are in this assessment"""
+confidence = how confident you are in the tentative identification
+If is_card or usable is false, fill tentative_id fields with "Unknown"."""
 
-    try:
-        resp = client.messages.create(
-            model=MODEL_FAST,
-            max_tokens=150,
-            messages=[{
-                "role": "user",
-                "content": [
-                    {"type": "image", "source": {"type": "base64", "media_type": media_type, "data": b64}},
-                    {"type": "text", "text": prompt}
-                ]
-            }]
-        )
-        text = resp.content[0].text.strip()
-        # Strip markdown if present
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-        result = json.loads(text)
-        result["_input_tok"]  = resp.usage.input_tokens
-        result["_output_tok"] = resp.usage.output_tokens
-        return result
-    except Exception as e:
-        # If prescreen fails, assume it's a card and let the main identifier try
-        return {"is_card": True, "usable": True, "reason": f"prescreen error: {e}", "confidence": 0.5,
-                "_input_tok": 0, "_output_tok": 0}
 
+def prescreen_and_identify(client: anthropic.Anthropic, image_path: str) -> dict:
+    """
+    Fused prescreen + tentative ID: one Haiku call instead of the
+    prescreen-then-identify pair, saving a full round-trip for the common
+    confident case. Returns the usual prescreen verdict dict plus
+    "tentative_id" and "needs_refinement" — when the latter is set (usable
+    card, confidence under ESCALATE_THRESHOLD) the caller should run the
+    full MODEL_SMART identifier on the same image. The two-call path stays
+    the default for callers that need the detailed SSP/numbering schema.
+    """
+    path = Path(image_path)
+    with _image_buffer(path) as buf:
+        # Fused verdicts carry the tentative_id, so they get their own cache
+        # namespace alongside the plain prescreen entries.
+        digest = "fused-" + _prescreen_digest(buf)
+        result = _prescreen_cache_get(digest)
+        b64 = media_type = None
+        if result is None:
+            b64, media_type = _encode_bytes(buf)
+
+    if result is None:
+        try:
+            resp = _with_retries(lambda: client.messages.create(
+                model=MODEL_FAST,
+                max_tokens=400,
+                messages=[{
+                    "role": "user",
+                    "content": [
+                        {"type": "image", "source": {"type": "base64", "media_type": media_type, "data": b64}},
+                        {"type": "text", "text": _FUSED_PROMPT}
+                    ]
+                }]
+            ))
+            result = _prescreen_result(resp)
+            _prescreen_cache_put(digest, result)
+        except Exception as e:
+            result = _prescreen_fallback(e)
+
+    result.setdefault("tentative_id", {})
+    result["needs_refinement"] = bool(
+        result.get("is_card") and result.get("usable")
+        and result.get("confidence", 0.0) < ESCALATE_THRESHOLD
+    )
+    return result
 
-def route_identify(confidence_score: float, attempt: int = 1) -> str:
+
+def route_identify(prescreen_conf: float, prev_conf: "float | None" = None,
+                   attempt: int = 1, had_validation_error: bool = False) -> str:
     """
-    Given confidence from a previous ID attempt, return the model to use next.
-    attempt=1 → first try
-    attempt=2 → retry (escalate if confidence was low)
+    Turn-aware model routing for identification.
+
+    attempt=1 → obvious cards (prescreen confidence above
+    FAST_ROUTE_THRESHOLD) start on Haiku, ~20x cheaper than Sonnet;
+    everything else starts on Sonnet.
+    attempt>=2 → escalate to Opus when the previous pass was
+    low-confidence, unparseable, or missing; otherwise stay on Sonnet.
     """
     if attempt == 1:
-        return MODEL_SMART
-    if confidence_score < ESCALATE_THRESHOLD:
-        return MODEL_BEST
-    return MODEL_SMART
+        model = MODEL_FAST if prescreen_conf > FAST_ROUTE_THRESHOLD else MODEL_SMART
+    elif had_validation_error or prev_conf is None or prev_conf < ESCALATE_THRESHOLD:
+        model = MODEL_BEST
+    else:
+        model = MODEL_SMART
+    _router_log.info("turn=%d model=%s", attempt, model)
+    return model
+
+
+# Integer twins of the float thresholds, for the quantized fast path below.
+_FAST_ROUTE_INT = round(FAST_ROUTE_THRESHOLD * 100)
+_ESCALATE_INT = round(ESCALATE_THRESHOLD * 100)
+
+
+@lru_cache(maxsize=256)
+def route_identify_fast(conf_int: int, attempt: int = 1) -> str:
+    """route_identify for hot loops: confidence quantized to int(conf * 100),
+    same routing table, memoized (the input domain is ~200 pairs, so after
+    warmup every call is one dict hit — no float compares, no log record).
+    Callers with a validation error or no previous confidence should keep
+    using route_identify, which handles those cases."""
+    if attempt == 1:
+        return MODEL_FAST if conf_int > _FAST_ROUTE_INT else MODEL_SMART
+    return MODEL_BEST if conf_int < _ESCALATE_INT else MODEL_SMART
+
+
+# Prompt bodies are module constants filled via format_map — one pass over
+# the template instead of per-call f-string assembly with repeated
+# dict.get lookups; matters when the batching path queues thousands.
+_SUMMARY_PROMPT = """Write a 1-2 sentence value summary for this sports card. Be brief and factual.
+Card: {player_name} {year} {set_name} {parallel}
+Estimated value: ${value:.2f}
+RC: {is_rookie}, Auto: {is_auto}, Serial: {numbering}"""
+
+_GRADING_PROMPT = """Give a 1-sentence PSA grading recommendation for this card.
+{player_name} {year} {set_name}
+Raw value: ${value:.2f}. Is RC: {is_rookie}
+Be direct: should they grade it, and why (ROI, protection, etc)?"""
+
+_FUSED_SUMMARY_PROMPT = """For this sports card, answer ONLY with valid JSON, no other text:
+{{"summary": "1-2 sentence value summary, brief and factual",
+ "grading": "1-sentence PSA grading recommendation — should they grade it, and why (ROI, protection, etc)?"}}
+Card: {player_name} {year} {set_name} {parallel}
+Estimated value: ${value:.2f}
+RC: {is_rookie}, Auto: {is_auto}, Serial: {numbering}"""
+
+_PROMPT_DEFAULTS = {"parallel": "Base", "numbering": "N/A",
+                    "is_rookie": False, "is_auto": False}
+
+
+class _PromptVars(dict):
+    """format_map view over card_data with the old .get(...) defaults."""
+    def __missing__(self, key):
+        # None for un-defaulted keys — same rendering as .get(key) before
+        return _PROMPT_DEFAULTS.get(key)
+
 
+def _summary_prompt(card_data: dict, value: float) -> str:
+    return _SUMMARY_PROMPT.format_map(_PromptVars(card_data, value=value))
 
-def summarize_card_value(client: anthropic.Anthropic, card_data: dict, value: float) -> str:
+
+def _grading_prompt(card_data: dict, raw_value: float) -> str:
+    return _GRADING_PROMPT.format_map(_PromptVars(card_data, value=raw_value))
+
+
+def summarize_card_value(client: "anthropic.Anthropic | None", card_data: dict, value: float) -> str:
     """
     TIER 1 — Haiku generates a short value narrative for the card detail page.
     Cheap task: just formatting + light commentary.
+    For bulk jobs, queue through BatchedHaikuClient instead.
     """
-    prompt = f"""Write a 1-2 sentence value summary for this sports card. Be brief and factual.
-Card: {card_data.get('player_name')} {card_data.get('year')} {card_data.get('set_name')} {card_data.get('parallel', 'Base')}
-Estimated value: ${value:.2f}
-RC: {card_data.get('is_rookie', False)}, Auto: {card_data.get('is_auto', False)}, Serial: {card_data.get('numbering', 'N/A')}"""
+    client = client or get_client()
+    prompt = _summary_prompt(card_data, value)
 
     try:
-        resp = client.messages.create(
+        resp = _with_retries(lambda: client.messages.create(
             model=MODEL_FAST,
-            max_tokens=120,
+            max_tokens=70,
             messages=[{"role": "user", "content": prompt}]
-        )
+        ))
         return resp.content[0].text.strip()
     except Exception:
         return f"Estimated value: ${value:.2f}"
 
 
-def get_grading_advice(client: anthropic.Anthropic, card_data: dict, raw_value: float) -> str:
+def get_grading_advice(client: "anthropic.Anthropic | None", card_data: dict, raw_value: float) -> str:
     """
     TIER 1 — Haiku generates grading recommendation copy.
     Only called for cards over $50.
+    For bulk jobs, queue through BatchedHaikuClient instead.
     """
-    prompt = f"""Give a 1-sentence PSA grading recommendation for this card.
-{card_data.get('player_name')} {card_data.get('year')} {card_data.get('set_name')}
-Raw value: ${raw_value:.2f}. Is RC: {card_data.get('is_rookie', False)}
-Be direct: should they grade it, and why (ROI, protection, etc)?"""
+    client = client or get_client()
+    prompt = _grading_prompt(card_data, raw_value)
 
     try:
-        resp = client.messages.create(
+        resp = _with_retries(lambda: client.messages.create(
             model=MODEL_FAST,
-            max_tokens=100,
+            max_tokens=60,
             messages=[{"role": "user", "content": prompt}]
-        )
+        ))
         return resp.content[0].text.strip()
     except Exception:
         return "Consider grading if condition is NM or better."
 
 
+def summarize_and_grade(client: "anthropic.Anthropic | None",
+                        card_data: dict, raw_value: float) -> tuple[str, str]:
+    """
+    TIER 1 — value summary and grading advice from one Haiku call.
+    Cards over $50 need both; they share the card data, so fusing them
+    halves the API calls and the latency on those detail pages.
+    Returns (summary, grading) — each falls back to the same static copy
+    as its single-purpose counterpart on error or missing field.
+    """
+    client = client or get_client()
+    prompt = _FUSED_SUMMARY_PROMPT.format_map(_PromptVars(card_data, value=raw_value))
+
+    try:
+        resp = _with_retries(lambda: client.messages.create(
+            model=MODEL_FAST,
+            max_tokens=180,
+            messages=[{"role": "user", "content": prompt}]
+        ))
+        parsed = _loads(_FENCE_RE.sub("", resp.content[0].text.strip()))
+    except Exception:
+        parsed = {}
+    return (parsed.get("summary") or f"Estimated value: ${raw_value:.2f}",
+            parsed.get("grading") or "Consider grading if condition is NM or better.")
+
+
+def _stream_haiku(client: "anthropic.Anthropic | None", prompt: str,
+                  max_tokens: int, fallback: str):
+    """Yield response text chunks as they decode. The full text takes the
+    same wall-clock as messages.create, but the first words render without
+    waiting for the rest of the decode. On error, yields the fallback copy
+    (whole, possibly after partial output) so the UI never ends blank."""
+    client = client or get_client()
+    try:
+        with client.messages.stream(
+            model=MODEL_FAST,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+    except Exception:
+        yield fallback
+
+
+def summarize_card_value_stream(client: "anthropic.Anthropic | None",
+                                card_data: dict, value: float):
+    """Streaming summarize_card_value — yields text chunks for SSE routes;
+    same prompt, budget, and fallback copy as the blocking variant."""
+    yield from _stream_haiku(client, _summary_prompt(card_data, value), 70,
+                             f"Estimated value: ${value:.2f}")
+
+
+def get_grading_advice_stream(client: "anthropic.Anthropic | None",
+                              card_data: dict, raw_value: float):
+    """Streaming get_grading_advice — yields text chunks for SSE routes."""
+    yield from _stream_haiku(client, _grading_prompt(card_data, raw_value), 60,
+                             "Consider grading if condition is NM or better.")
+
+
+# ── Batched Haiku calls (bulk, non-interactive) ─────────────────────────────
+
+class BatchedHaikuClient:
+    """
+    Accumulates Haiku requests and flushes them through the Message Batches
+    API — ~50% cheaper per token, one HTTP exchange instead of N.
+
+    For bulk jobs only (import-time summaries, mass grading advice): results
+    arrive when the batch ends, minutes not milliseconds, so interactive
+    paths should keep calling summarize_card_value / get_grading_advice
+    directly. queue_* returns a Future; it resolves after the batch that
+    contains it completes (auto-flush at FLUSH_THRESHOLD, or call flush()
+    when done queueing). A failed entry resolves to None so callers can fall
+    back to their static copy.
+    """
+
+    FLUSH_THRESHOLD = 100
+    POLL_INTERVAL = 5.0  # seconds between processing_status checks
+
+    def __init__(self, client: anthropic.Anthropic):
+        self.client = client
+        self._pending = []   # request dicts awaiting the next flush
+        self._futures = {}   # custom_id -> Future
+        self._seq = 0
+
+    def queue_summary(self, card_data: dict, value: float) -> Future:
+        return self._queue(_summary_prompt(card_data, value), max_tokens=70)
+
+    def queue_grading(self, card_data: dict, raw_value: float) -> Future:
+        return self._queue(_grading_prompt(card_data, raw_value), max_tokens=60)
+
+    def _queue(self, prompt: str, max_tokens: int) -> Future:
+        custom_id = f"haiku-{self._seq}"
+        self._seq += 1
+        future = Future()
+        self._futures[custom_id] = future
+        self._pending.append({
+            "custom_id": custom_id,
+            "params": {
+                "model": MODEL_FAST,
+                "max_tokens": max_tokens,
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        })
+        if len(self._pending) >= self.FLUSH_THRESHOLD:
+            self.flush()
+        return future
+
+    def flush(self) -> None:
+        """Submit everything queued, wait for the batch, resolve futures.
+        Every flushed entry's Future resolves — to None on a failed batch or
+        a result the batch never reported — so future.result() can't hang."""
+        if not self._pending:
+            return
+        requests, self._pending = self._pending, []
+        flushed = [r["custom_id"] for r in requests]
+
+        try:
+            batch = self.client.messages.batches.create(requests=requests)
+            while batch.processing_status != "ended":
+                time.sleep(self.POLL_INTERVAL)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            for entry in self.client.messages.batches.results(batch.id):
+                future = self._futures.pop(entry.custom_id, None)
+                if future is None:
+                    continue
+                if entry.result.type == "succeeded":
+                    future.set_result(entry.result.message.content[0].text.strip())
+                else:
+                    future.set_result(None)
+        except Exception:
+            pass  # fall through — unresolved entries get the failure value
+
+        for custom_id in flushed:
+            future = self._futures.pop(custom_id, None)
+            if future is not None:
+                future.set_result(None)
+
+
 # ── Usage summary (for logging/monitoring) ──────────────────────────────────
 
 MODEL_COSTS = {
-    MODEL_FAST:  {"input": 0.80,  "output": 4.00},   # per million tokens
-    MODEL_SMART: {"input": 3.00,  "output": 15.00},
-    MODEL_BEST:  {"input": 15.00, "output": 75.00},
+    MODEL_FAST:  {"input": 0.80,  "output": 4.00,  "cache_read": 0.08},   # per million tokens
+    MODEL_SMART: {"input": 3.00,  "output": 15.00, "cache_read": 0.30},
+    MODEL_BEST:  {"input": 15.00, "output": 75.00, "cache_read": 1.50},
 }
 
-def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
-    """Returns estimated cost in USD."""
-    costs = MODEL_COSTS.get(model, MODEL_COSTS[MODEL_SMART])
-    return (input_tokens / 1_000_000 * costs["input"]) + (output_tokens / 1_000_000 * costs["output"])
+# Per-token (input, output, cache_read) rates, pre-divided from MODEL_COSTS
+# so the hot path below is three multiplies — no nested dict lookups or
+# per-call division when billing reconciliation loops over usage rows.
+_RATES = {model: (c["input"] / 1_000_000, c["output"] / 1_000_000,
+                  c["cache_read"] / 1_000_000)
+          for model, c in MODEL_COSTS.items()}
+_DEFAULT_RATES = _RATES[MODEL_SMART]
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int,
+                  cache_read_tokens: int = 0) -> float:
+    """Returns estimated cost in USD. Pass resp.usage.cache_read_input_tokens
+    separately — cached prompt reads bill at ~10% of the normal input rate."""
+    ri, ro, rc = _RATES.get(model, _DEFAULT_RATES)
+    return input_tokens * ri + output_tokens * ro + cache_read_tokens * rc
+
+
+_LEDGER_MODELS = (MODEL_FAST, MODEL_SMART, MODEL_BEST)
+_LEDGER_IDX = {m: i for i, m in enumerate(_LEDGER_MODELS)}
+
+
+class UsageLedger:
+    """Accumulates per-call token usage so dashboards can price a whole
+    session in one pass instead of calling estimate_cost row by row.
+
+    record() is a plain list append; total_cost() gathers the per-model
+    rate rows with NumPy when it is installed and falls back to the
+    scalar loop otherwise. Unknown models price at the MODEL_SMART rate,
+    matching estimate_cost.
+    """
+
+    def __init__(self):
+        # (model_idx, input_tokens, output_tokens, cache_read_tokens)
+        self._rows: list = []
+
+    def record(self, model: str, input_tokens: int, output_tokens: int,
+               cache_read_tokens: int = 0) -> None:
+        idx = _LEDGER_IDX.get(model, _LEDGER_IDX[MODEL_SMART])
+        self._rows.append((idx, input_tokens, output_tokens, cache_read_tokens))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def total_cost(self) -> float:
+        """Total estimated spend in USD across all recorded calls."""
+        if not self._rows:
+            return 0.0
+        if _np is None:
+            return sum(estimate_cost(_LEDGER_MODELS[i], tin, tout, tcache)
+                       for i, tin, tout, tcache in self._rows)
+        rows = _np.asarray(self._rows, dtype=_np.int64)
+        rates = _np.array([[MODEL_COSTS[m][k]
+                            for k in ("input", "output", "cache_read")]
+                           for m in _LEDGER_MODELS]) / 1_000_000
+        return float((rows[:, 1:] * rates[rows[:, 0]]).sum())